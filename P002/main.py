@@ -1,15 +1,28 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import os
+import sys
 
-from src.preprocessamento import preprocess_data
+from src.preprocessamento import load_preprocessed
 from src.utils import generate_neighbors
 from src.algoritmos import KMeans, local_search
-from src.vizualizacao import plot_kmeans_results
 from src.tabu import tabu_search
-from tabulate import tabulate
-import numpy as np
+from src.paralelo import ParallelEvaluator
+from src.parada import StoppingCriteria
 
 NUM_PASSOS = 1
+N_INIT = 10      # Reinícios independentes do K-Means
+SEMENTE = 42     # Semente dos reinícios do K-Means
+N_PROCESSOS = 1  # Processos na avaliação da vizinhança (melhor melhora e tabu); 1 = sequencial
+
+# Critérios de parada da busca tabu (None = desativado)
+MAX_ITER_TABU = 150       # Limite de iterações
+PACIENCIA_TABU = None     # Iterações consecutivas sem melhora toleradas
+MELHORA_MINIMA = 0.0      # Melhora relativa mínima para reiniciar a paciência
+MAX_AVALIACOES = None     # Orçamento de avaliações de candidatos
+LIMITE_TEMPO = None       # Limite de tempo, em segundos
+
+# Modo sem interface gráfica (servidores, execuções em lote): `python main.py --headless`
+# ou HEADLESS=1. Os gráficos não são gerados e o matplotlib nem chega a ser importado.
+HEADLESS = "--headless" in sys.argv[1:] or os.environ.get("HEADLESS", "0") not in ("", "0")
 
 #----------------------------------------------------------
 # Função principal de execução
@@ -21,10 +34,10 @@ def main():
     # Resultados armazenados para a tabela
     resultados = []
    
-    # Carregar e preparar os dados
-    data = load_data("data/wine.data")
+    # Carregar e preparar os dados (matriz normalizada em cache binário, reaproveitada entre execuções);
+    # a primeira linha do arquivo é lida como cabeçalho, como nas versões anteriores
     features = ['Flavanoids', 'Total_Phenols']
-    reduced_data, scaler = preprocess_data(data, features)
+    reduced_data, scaler = load_preprocessed("data/wine.data", features, header=0)
 
     # Executar K-Means
     kmeans = execute_kmeans(reduced_data, n_clusters=3)
@@ -54,35 +67,55 @@ def main():
     print("Custo total da busca local (primeira melhora):", first_distance)
     print_separator()
 
-    # Busca local (melhor melhora)
-    best_centroids, best_distance, history_best = local_search(
-        reduced_data,
-        kmeans.centroids,
-        neighbors_local,
-        mode="best"
-    )
-
-    resultados.append(["Busca Local (Melhor Melhora)", best_centroids.tolist(), best_distance, history_best])
-    print("Melhores centróides encontrados (Melhor Melhora):", best_centroids)
-    print("Custo total da busca local (melhor melhora):", best_distance)
-    print_separator()
-
-    # Visualizar resultados (comparação K-Means vs. Busca Local)
-    plot_results(reduced_data, kmeans, best_centroids, history_first, history_best)
-
-    # Busca tabu
-    neighbors_tabu = neighbors.copy()
-    best_centroids_tabu, best_cost_tabu, history_tabu = tabu_search(
-        reduced_data,
-        kmeans.centroids,
-        neighbors_tabu,
-        max_iter=150,
-        tabu_size=150
-    )
+    # Avaliador paralelo (dados em memória compartilhada) para as varreduras completas
+    evaluator = ParallelEvaluator(reduced_data, n_workers=N_PROCESSOS) if N_PROCESSOS > 1 else None
+
+    try:
+        # Busca local (melhor melhora)
+        best_centroids, best_distance, history_best = local_search(
+            reduced_data,
+            kmeans.centroids,
+            neighbors_local,
+            mode="best",
+            evaluator=evaluator
+        )
+
+        resultados.append(["Busca Local (Melhor Melhora)", best_centroids.tolist(), best_distance, history_best])
+        print("Melhores centróides encontrados (Melhor Melhora):", best_centroids)
+        print("Custo total da busca local (melhor melhora):", best_distance)
+        print_separator()
+
+        # Visualizar resultados (comparação K-Means vs. Busca Local)
+        if not HEADLESS:
+            plot_results(reduced_data, kmeans, best_centroids, history_first, history_best)
+
+        # Busca tabu
+        neighbors_tabu = neighbors.copy()
+        stopping = StoppingCriteria(
+            max_iter=MAX_ITER_TABU,
+            patience=PACIENCIA_TABU,
+            min_improvement=MELHORA_MINIMA,
+            max_evaluations=MAX_AVALIACOES,
+            time_limit=LIMITE_TEMPO
+        )
+        best_centroids_tabu, best_cost_tabu, history_tabu = tabu_search(
+            reduced_data,
+            kmeans.centroids,
+            neighbors_tabu,
+            tabu_size=150,
+            evaluator=evaluator,
+            stopping=stopping
+        )
+    finally:
+        # Encerra o pool e libera a memória compartilhada mesmo se uma das buscas falhar
+        if evaluator is not None:
+            evaluator.close()
     
     resultados.append(["Busca Tabu", best_centroids_tabu.tolist(), best_cost_tabu, history_tabu])
     print("Melhores centróides pela busca tabu:", best_centroids_tabu)
     print("Custo final da busca tabu:", best_cost_tabu)
+    print(f"Parada da busca tabu: {stopping.reason} "
+          f"({stopping.iterations} iterações, {stopping.evaluations} avaliações)")
     print_separator()
 
     # Plotar históricos de custo de todos os métodos
@@ -92,42 +125,28 @@ def main():
     # Cria as retas horizontais com base no tamanho do histórico da busca tabu
     horizontal_first = [min_first] * len(history_tabu)
     horizontal_best = [min_best] * len(history_tabu)
-    plot_cost_histories({
-        "Busca Local (Primeira Melhora)": horizontal_first,
-        "Busca Local (Melhor Melhora)": horizontal_best,
-        "Busca Tabu": history_tabu
-    })
+    if not HEADLESS:
+        plot_cost_histories({
+            "Busca Local (Primeira Melhora)": horizontal_first,
+            "Busca Local (Melhor Melhora)": horizontal_best,
+            "Busca Tabu": history_tabu
+        })
 
     # Exibir tabela de resultados
     print("\n## RESUMO DOS RESULTADOS ##\n")
     mostrar_tabela_resultados(resultados)
 
 
-#----------------------------------------------------------
-# Função para carregar dados
-def load_data(file_path):
-    data = pd.read_csv(file_path)
-    data.columns = [
-        'Class', 'Alcohol', 'Malic_Acid', 'Ash', 'Alcalinity_of_Ash',
-        'Magnesium', 'Total_Phenols', 'Flavanoids', 'Nonflavanoid_Phenols',
-        'Proanthocyanins', 'Color_Intensity', 'Hue',
-        'OD280/OD315_of_Diluted_Wines', 'Proline'
-    ]
-    return data
-
-
 #----------------------------------------------------------
 # Função para executar o K-Means
 def execute_kmeans(data, n_clusters):
     """
     Instancia e executa o KMeans nos dados fornecidos.
-    """
-    kmeans = KMeans(n_clusters=n_clusters)
 
-    # Iniciar centróides com valores fixos (melhor saida do KMeans até então)
-    kmeans.centroids = centroids = np.array([[0.23242425, 0.16964401], 
-                                  [-1.00234577, -0.99855091], 
-                                  [1.11694924, 1.17118187]])
+    Os centróides iniciais são sorteados por k-means++ em vários reinícios
+    independentes (executados em paralelo), mantendo o de menor custo.
+    """
+    kmeans = KMeans(n_clusters=n_clusters, n_init=N_INIT, random_state=SEMENTE)
     kmeans.fit(data)
     print("Centroides encontrados pelo K-Means:\n", kmeans.centroids)
     return kmeans
@@ -140,6 +159,10 @@ def plot_results(reduced_data, kmeans, centroids_best, history_first, history_be
     Plota resultados comparando os centróides do K-Means e da busca local.
     Além disso, plota o histórico de custo para comparação.
     """
+    # Importados apenas quando há gráficos a exibir
+    import matplotlib.pyplot as plt
+    from src.vizualizacao import plot_kmeans_results
+
     plot_kmeans_results(reduced_data, kmeans.centroids, kmeans.labels)
 
     # Centróides da busca local (Melhor Melhora)
@@ -172,6 +195,8 @@ def plot_results(reduced_data, kmeans, centroids_best, history_first, history_be
 #----------------------------------------------------------
 # Função para plotar históricos de custos
 def plot_cost_histories(histories):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     for label, history in histories.items():
         plt.plot(history, label=label, marker="o")
@@ -192,6 +217,8 @@ def print_separator():
 #----------------------------------------------------------
 # Função para exibir a tabela de resultados
 def mostrar_tabela_resultados(resultados):
+    from tabulate import tabulate
+
     headers = ["Metodo", "Centroides Encontrados", "Custo Total", "Histórico de Custos"]
     resultados_formatados = [
         [metodo, centroides, custo, len(hist)] 
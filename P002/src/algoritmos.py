@@ -1,6 +1,12 @@
+import os
 import numpy as np
 import random
-from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+from src.custo import CostState, nearest_centroids, pairwise_distances
+from src.vizinhanca import NeighborhoodSpace
+
+# Quantidade padrão de candidatos avaliados por passagem vetorizada
+BLOCK_SIZE = 256
 
 
 class KMeans:
@@ -11,13 +17,26 @@ class KMeans:
         n_clusters (int): Número de clusters desejados.
         max_iter (int): Número máximo de iterações.
         tol (float): Tolerância para verificar a convergência.
+        algorithm (str): Variante do ajuste ('lloyd', 'elkan', 'hamerly' ou 'minibatch').
+        batch_size (int): Tamanho dos lotes amostrados no modo 'minibatch'.
+        init (str): Inicialização dos centróides ('k-means++' ou 'random').
+        n_init (int): Quantidade de reinícios independentes; o de menor custo é mantido.
+        n_jobs (int): Quantidade de processos usados nos reinícios (None usa todos os núcleos).
+        random_state (int): Semente dos reinícios (None para não determinístico).
         centroids (np.ndarray): Matriz contendo os centróides no formato (n_clusters, n_features).
         data (np.ndarray): Dados de entrada no formato (n_samples, n_features).
         labels (np.ndarray): Array contendo o índice do cluster para cada ponto.
+        counts (np.ndarray): Quantidade de pontos já absorvidos por centróide nas
+                             atualizações incrementais ('minibatch' e `partial_fit`).
     """
-    __slots__ = ['n_clusters', 'max_iter', 'tol', 'centroids', 'data', 'labels']
+    __slots__ = ['n_clusters', 'max_iter', 'tol', 'algorithm', 'batch_size', 'init', 'n_init', 'n_jobs', 'random_state',
+                 'centroids', 'data', 'labels', 'counts']
+
+    ALGORITHMS = ("lloyd", "elkan", "hamerly", "minibatch")
+    INITS = ("k-means++", "random")
 
-    def __init__(self, n_clusters, max_iter=100, tol=1e-4, initial_centroids=None):
+    def __init__(self, n_clusters, max_iter=100, tol=1e-4, initial_centroids=None, algorithm="lloyd", batch_size=1024,
+                 init="k-means++", n_init=1, n_jobs=None, random_state=None):
         """
         Construtor da classe KMeans.
 
@@ -26,10 +45,38 @@ class KMeans:
         :param tol: Tolerância para verificação de convergência (padrão: 1e-4).
         :param initial_centroids: Centróides iniciais (opcional). Caso não fornecido,
                                   podem ser inicializados automaticamente com `fit`.
+        :param algorithm: Variante do ajuste (padrão: 'lloyd'):
+                          - 'lloyd' calcula todas as distâncias ponto-centróide a cada iteração,
+                          - 'elkan' mantém um limite inferior por par ponto-centróide e
+                            usa a desigualdade triangular para pular distâncias,
+                          - 'hamerly' mantém apenas um limite inferior por ponto
+                            (menos memória que 'elkan', indicado para k pequeno),
+                          - 'minibatch' atualiza os centróides a partir de lotes
+                            aleatórios de `batch_size` pontos por iteração.
+        :param batch_size: Tamanho dos lotes do modo 'minibatch' (padrão: 1024).
+        :param init: Inicialização quando não há centróides iniciais (padrão: 'k-means++'):
+                     - 'k-means++' sorteia cada centróide com probabilidade proporcional
+                       ao quadrado da distância ao centróide mais próximo já escolhido,
+                     - 'random' sorteia n_clusters amostras uniformemente.
+        :param n_init: Quantidade de reinícios independentes (padrão: 1). Ignorado
+                       quando os centróides iniciais são fornecidos.
+        :param n_jobs: Quantidade de processos para os reinícios (padrão: None, todos os núcleos).
+        :param random_state: Semente dos reinícios (padrão: None).
         """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError("Algoritmo inválido. Use 'lloyd', 'elkan', 'hamerly' ou 'minibatch'.")
+        if init not in self.INITS:
+            raise ValueError("Inicialização inválida. Use 'k-means++' ou 'random'.")
+
         self.n_clusters = n_clusters
         self.max_iter = max_iter
         self.tol = tol
+        self.algorithm = algorithm
+        self.batch_size = batch_size
+        self.init = init
+        self.n_init = n_init
+        self.n_jobs = n_jobs
+        self.random_state = random_state
         
         # Caso sejam passados centróides iniciais, faça o cast para numpy array.
         # Caso contrário, deixe para ser inicializado no `fit`.
@@ -38,6 +85,7 @@ class KMeans:
         # Serão definidas posteriormente
         self.data = None
         self.labels = None
+        self.counts = None
 
     def fit(self, data):
         """
@@ -46,33 +94,352 @@ class KMeans:
         :param data: Dados de entrada no formato (n_amostras, n_features).
         :return: Retorna a instância do próprio objeto (self).
         """
+        # Sem centróides iniciais e com vários reinícios, mantém o melhor deles
+        if self.centroids is None and self.n_init > 1:
+            return self._fit_restarts(data)
+
         self.data = data
-        n_samples, _ = data.shape
+        rng = np.random.default_rng(self.random_state)
 
-        # Se os centróides não foram definidos manualmente, inicializa aleatoriamente.
+        # Se os centróides não foram definidos manualmente, inicializa pelo método escolhido.
         if self.centroids is None:
-            # Escolhe n_clusters amostras aleatórias como centróides iniciais
-            idx = np.random.choice(n_samples, self.n_clusters, replace=False)
-            self.centroids = data[idx, :]
+            self.centroids = self._initial_centroids(data, rng)
+
+        if self.algorithm == "minibatch":
+            self._fit_minibatch(data, rng)
+        elif self.algorithm == "elkan":
+            self._fit_elkan(data)
+        elif self.algorithm == "hamerly":
+            self._fit_hamerly(data)
+        else:
+            self._fit_lloyd(data)
+
+        return self
+
+    def _fit_lloyd(self, data):
+        """
+        Iterações de Lloyd: atribuição por matriz completa de distâncias.
 
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        """
         for _ in range(self.max_iter):
             # Atribui cada ponto ao cluster mais próximo
-            self.labels = np.array([self._closest_centroid(point) for point in data])
-
-            # Atualiza os centróides baseados na média dos pontos pertencentes a cada cluster
-            new_centroids = np.array([
-                data[self.labels == i].mean(axis=0) if np.any(self.labels == i) else self.centroids[i] 
-                for i in range(self.n_clusters)
-            ])
-
-            # Checa a convergência pela norma da diferença entre antigos e novos centróides
-            shift = np.linalg.norm(new_centroids - self.centroids)
-            self.centroids = new_centroids
-            if shift < self.tol:
+            _, self.labels = nearest_centroids(data, self.centroids)
+
+            # Atualiza os centróides e checa a convergência
+            if self._update_centroids(data) < self.tol:
+                break
+
+    def _initial_centroids(self, data, rng):
+        """
+        Escolhe os centróides iniciais entre as amostras, por 'k-means++' ou 'random'.
+
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        :param rng: Gerador de números aleatórios (np.random.Generator).
+        :return: Centróides iniciais (n_clusters, n_features).
+        """
+        n_samples = data.shape[0]
+        if self.init == "random":
+            # Escolhe n_clusters amostras aleatórias como centróides iniciais
+            return data[rng.choice(n_samples, self.n_clusters, replace=False), :]
+
+        centroids = np.empty((self.n_clusters, data.shape[1]))
+        centroids[0] = data[rng.integers(n_samples)]
+        closest = self._distances(data, centroids[:1])[:, 0] ** 2
+
+        for i in range(1, self.n_clusters):
+            # Sorteio proporcional ao quadrado da distância ao centróide mais próximo
+            total = closest.sum()
+            probabilities = closest / total if total > 0 else None
+            centroids[i] = data[rng.choice(n_samples, p=probabilities)]
+            np.minimum(closest, self._distances(data, centroids[i:i + 1])[:, 0] ** 2, out=closest)
+
+        return centroids
+
+    def _fit_restarts(self, data):
+        """
+        Executa `n_init` ajustes independentes, cada um com sua própria semente,
+        em um pool de processos, e mantém o de menor custo (`compute_cost`).
+
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        :return: Retorna a instância do próprio objeto (self).
+        """
+        params = {
+            "n_clusters": self.n_clusters, "max_iter": self.max_iter, "tol": self.tol,
+            "algorithm": self.algorithm, "batch_size": self.batch_size, "init": self.init,
+        }
+        seeds = np.random.SeedSequence(self.random_state).spawn(self.n_init)
+        n_jobs = min(self.n_jobs or os.cpu_count() or 1, self.n_init)
+
+        if n_jobs == 1:
+            _set_restart_data(data)
+            results = [_fit_restart(params, seed) for seed in seeds]
+        else:
+            # Os dados são enviados uma única vez por processo, no inicializador
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_set_restart_data, initargs=(data,)) as executor:
+                results = list(executor.map(_fit_restart, [params] * self.n_init, seeds))
+
+        self.centroids, self.labels, _, self.counts = min(results, key=lambda result: result[2])
+        self.data = data
+        return self
+
+    def _fit_minibatch(self, data, rng):
+        """
+        Iterações mini-batch: cada iteração amostra um lote de pontos e aplica a
+        atualização incremental de `partial_fit`. Ao final, todos os pontos são
+        rotulados com os centróides obtidos.
+
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        :param rng: Gerador de números aleatórios (np.random.Generator).
+        """
+        n_samples = data.shape[0]
+        batch_size = min(self.batch_size, n_samples)
+        self.counts = np.zeros(self.n_clusters)
+
+        for _ in range(self.max_iter):
+            # Amostragem com reposição: custo proporcional ao lote, não ao conjunto de dados
+            batch = data[rng.integers(0, n_samples, batch_size)]
+            if self._incremental_update(batch) < self.tol:
                 break
 
+        self.data = data
+        self.labels = self.predict(data)
+
+    def partial_fit(self, chunk):
+        """
+        Atualiza o modelo com um bloco de dados, sem revisitar os blocos anteriores.
+
+        Cada centróide tem sua própria taxa de aprendizado, igual ao inverso da
+        quantidade de pontos que já absorveu; assim o centróide é a média corrente
+        dos pontos atribuídos a ele ao longo de todos os blocos. Permite ajustar o
+        modelo com dados lidos aos poucos do disco.
+
+        Após a chamada, `data` e `labels` referem-se ao último bloco recebido.
+
+        :param chunk: Bloco de dados no formato (n_amostras, n_features).
+        :return: Retorna a instância do próprio objeto (self).
+        """
+        chunk = np.asarray(chunk, dtype=float)
+
+        if self.centroids is None:
+            if chunk.shape[0] < self.n_clusters:
+                raise ValueError("O primeiro bloco deve ter pelo menos n_clusters pontos para inicializar os centróides.")
+            self.centroids = self._initial_centroids(chunk, np.random.default_rng(self.random_state))
+
+        if self.counts is None:
+            self.counts = np.zeros(self.n_clusters)
+
+        self._incremental_update(chunk)
+        self.data = chunk
         return self
 
+    def predict(self, data):
+        """
+        Retorna o índice do centróide mais próximo de cada ponto.
+
+        :param data: Dados no formato (n_amostras, n_features).
+        :return: Array de rótulos (n_amostras,).
+        """
+        if self.centroids is None:
+            raise ValueError("O modelo não foi ajustado. Chame `fit` ou `partial_fit` antes de `predict`.")
+        _, labels = nearest_centroids(data, self.centroids)
+        return labels
+
+    def _incremental_update(self, batch):
+        """
+        Aplica a atualização de média corrente por centróide com um lote de pontos.
+
+        Equivale a mover o centróide c em direção a cada ponto x atribuído a ele com
+        taxa 1 / counts[c], mas usando somas por cluster em uma única passagem.
+
+        :param batch: Lote de pontos no formato (n_amostras, n_features).
+        :return: Norma da diferença entre os centróides antigos e os novos.
+        """
+        self.labels = self.predict(batch)
+        batch_counts = np.bincount(self.labels, minlength=self.n_clusters)
+        sums = np.stack([
+            np.bincount(self.labels, weights=batch[:, feature], minlength=self.n_clusters)
+            for feature in range(batch.shape[1])
+        ], axis=1)
+
+        total = self.counts + batch_counts
+        new_centroids = np.array(self.centroids, dtype=float)
+        filled = batch_counts > 0
+        new_centroids[filled] = ((self.counts[filled, np.newaxis] * new_centroids[filled] + sums[filled])
+                                 / total[filled, np.newaxis])
+
+        shift = np.linalg.norm(new_centroids - self.centroids)
+        self.centroids = new_centroids
+        self.counts = total
+        return shift
+
+    def _fit_hamerly(self, data):
+        """
+        Iterações de Hamerly: um limite superior (distância ao centróide atribuído)
+        e um limite inferior (distância ao segundo mais próximo) por ponto. Pontos
+        cujo limite superior não supera max(limite inferior, metade da distância
+        ao centróide vizinho mais próximo) mantêm o rótulo sem calcular distâncias.
+
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        """
+        rows = np.arange(data.shape[0])
+        distances = self._distances(data, self.centroids)
+        self.labels = np.argmin(distances, axis=1)
+        upper = distances[rows, self.labels]
+        distances[rows, self.labels] = np.inf
+        lower = np.min(distances, axis=1)
+
+        for iteration in range(self.max_iter):
+            if iteration > 0:
+                half_separation = 0.5 * self._centroid_separation()
+                bound = np.maximum(half_separation[self.labels], lower)
+
+                # Aperta o limite superior apenas onde ele não garante o rótulo
+                stale = np.flatnonzero(upper > bound)
+                upper[stale] = np.linalg.norm(data[stale] - self.centroids[self.labels[stale]], axis=1)
+                stale = stale[upper[stale] > bound[stale]]
+
+                if stale.size:
+                    distances = self._distances(data[stale], self.centroids)
+                    local_rows = np.arange(stale.size)
+                    labels = np.argmin(distances, axis=1)
+                    self.labels[stale] = labels
+                    upper[stale] = distances[local_rows, labels]
+                    distances[local_rows, labels] = np.inf
+                    lower[stale] = np.min(distances, axis=1)
+
+            previous = self.centroids
+            total_shift = self._update_centroids(data)
+
+            # Desloca os limites pelo movimento dos centróides
+            shift = np.linalg.norm(self.centroids - previous, axis=1)
+            upper += shift[self.labels]
+            lower -= np.max(shift)
+
+            if total_shift < self.tol:
+                break
+
+    def _fit_elkan(self, data):
+        """
+        Iterações de Elkan: um limite superior por ponto e um limite inferior por
+        par ponto-centróide. Uma distância só é calculada quando nenhum dos limites
+        (nem a desigualdade triangular entre centróides) descarta o centróide.
+
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        """
+        rows = np.arange(data.shape[0])
+        lower = self._distances(data, self.centroids)
+        self.labels = np.argmin(lower, axis=1)
+        upper = lower[rows, self.labels].copy()
+
+        for iteration in range(self.max_iter):
+            if iteration > 0:
+                centroid_distances = self._distances(self.centroids, self.centroids)
+                np.fill_diagonal(centroid_distances, np.inf)
+                half_separation = 0.5 * np.min(centroid_distances, axis=1)
+
+                candidates = np.flatnonzero(upper > half_separation[self.labels])
+                if candidates.size:
+                    self._elkan_reassign(data, candidates, upper, lower, centroid_distances)
+
+            previous = self.centroids
+            total_shift = self._update_centroids(data)
+
+            # Desloca os limites pelo movimento dos centróides
+            shift = np.linalg.norm(self.centroids - previous, axis=1)
+            upper += shift[self.labels]
+            np.maximum(lower - shift, 0, out=lower)
+
+            if total_shift < self.tol:
+                break
+
+    def _elkan_reassign(self, data, candidates, upper, lower, centroid_distances):
+        """
+        Reatribui, pelo critério de Elkan, os pontos que não foram descartados
+        pelo limite global.
+
+        :param data: Dados de entrada.
+        :param candidates: Índices dos pontos a reavaliar.
+        :param upper: Limites superiores (atualizados in-place).
+        :param lower: Limites inferiores por par ponto-centróide (atualizados in-place).
+        :param centroid_distances: Distâncias entre centróides (diagonal infinita).
+        """
+        labels = self.labels[candidates]
+        local_rows = np.arange(candidates.size)
+
+        def open_pairs(bound):
+            # Pares (ponto, centróide) que os limites não conseguem descartar
+            return ((bound[:, np.newaxis] > lower[candidates])
+                    & (bound[:, np.newaxis] > 0.5 * centroid_distances[labels]))
+
+        mask = open_pairs(upper[candidates])
+        mask[local_rows, labels] = False
+        active = np.flatnonzero(np.any(mask, axis=1))
+        if active.size == 0:
+            return
+
+        # Aperta o limite superior dos pontos ainda em aberto e refaz o teste
+        points = candidates[active]
+        exact = np.linalg.norm(data[points] - self.centroids[labels[active]], axis=1)
+        upper[points] = exact
+        lower[points, labels[active]] = exact
+        mask = open_pairs(upper[candidates])[active]
+        mask[np.arange(active.size), labels[active]] = False
+
+        pair_rows, pair_cols = np.nonzero(mask)
+        if pair_rows.size == 0:
+            return
+
+        pair_points = points[pair_rows]
+        pair_distances = np.linalg.norm(data[pair_points] - self.centroids[pair_cols], axis=1)
+        lower[pair_points, pair_cols] = pair_distances
+
+        # O novo rótulo é o mínimo entre a distância atual e as distâncias calculadas
+        best = np.full((active.size, self.n_clusters), np.inf)
+        best[np.arange(active.size), labels[active]] = exact
+        best[pair_rows, pair_cols] = pair_distances
+        new_labels = np.argmin(best, axis=1)
+        self.labels[points] = new_labels
+        upper[points] = best[np.arange(active.size), new_labels]
+
+    def _distances(self, points, centroids):
+        """
+        Matriz de distâncias euclidianas (n_points, n_centroids).
+        """
+        return pairwise_distances(points, centroids)
+
+    def _centroid_separation(self):
+        """
+        Distância de cada centróide ao centróide mais próximo.
+        """
+        centroid_distances = self._distances(self.centroids, self.centroids)
+        np.fill_diagonal(centroid_distances, np.inf)
+        return np.min(centroid_distances, axis=1)
+
+    def _update_centroids(self, data):
+        """
+        Atualiza os centróides pela média dos pontos de cada cluster, usando somas
+        por cluster (bincount) em uma única passagem pelos dados. Clusters vazios
+        mantêm o centróide anterior.
+
+        :param data: Dados de entrada no formato (n_amostras, n_features).
+        :return: Norma da diferença entre os centróides antigos e os novos.
+        """
+        counts = np.bincount(self.labels, minlength=self.n_clusters)
+        sums = np.stack([
+            np.bincount(self.labels, weights=data[:, feature], minlength=self.n_clusters)
+            for feature in range(data.shape[1])
+        ], axis=1)
+
+        new_centroids = np.array(self.centroids, dtype=float)
+        filled = counts > 0
+        new_centroids[filled] = sums[filled] / counts[filled, np.newaxis]
+
+        # Checa a convergência pela norma da diferença entre antigos e novos centróides
+        shift = np.linalg.norm(new_centroids - self.centroids)
+        self.centroids = new_centroids
+        return shift
+
     def _closest_centroid(self, point):
         """
         Calcula o índice do centróide mais próximo de um ponto.
@@ -106,6 +473,30 @@ class KMeans:
         return np.mean(distances)
 
 
+# Dados compartilhados pelos reinícios de um mesmo processo
+_restart_data = None
+
+
+def _set_restart_data(data):
+    """
+    Define os dados usados pelos reinícios do K-Means no processo corrente.
+    """
+    global _restart_data
+    _restart_data = data
+
+
+def _fit_restart(params, seed):
+    """
+    Executa um reinício independente do K-Means (usado pelo pool de processos).
+
+    :param params: Parâmetros do construtor de KMeans.
+    :param seed: Semente do reinício (np.random.SeedSequence).
+    :return: Tupla (centroids, labels, cost, counts).
+    """
+    kmeans = KMeans(**params, n_init=1, random_state=seed).fit(_restart_data)
+    return kmeans.centroids, kmeans.labels, kmeans.compute_cost(), kmeans.counts
+
+
 def compute_total_distance(data, centroids):
     """
     Calcula a soma das distâncias dos pontos aos seus centróides mais próximos.
@@ -114,13 +505,44 @@ def compute_total_distance(data, centroids):
     :param centroids: Centróides no formato (n_centroids, n_features).
     :return: Soma das distâncias.
     """
-    # Para cada ponto, calcule a distância até todos os centróides e pegue a menor
-    distances = np.linalg.norm(data[:, np.newaxis] - centroids, axis=2)
-    min_distances = np.min(distances, axis=1)
+    # Para cada ponto, a distância ao centróide mais próximo (força bruta ou KD-tree,
+    # conforme a quantidade de centróides e de pontos)
+    min_distances, _ = nearest_centroids(data, centroids)
     return np.sum(min_distances)
 
 
-def local_search(data, centroids, neighbors, mode="best"):
+def compute_total_distances(data, candidates):
+    """
+    Calcula, em uma única passagem vetorizada, a soma das distâncias dos pontos
+    aos centróides mais próximos para um bloco de configurações candidatas.
+
+    :param data: Dados no formato (n_samples, n_features).
+    :param candidates: Configurações candidatas no formato
+                       (n_candidates, n_centroids, n_features).
+    :return: Vetor (n_candidates,) com o custo de cada configuração.
+    """
+    # Para cada centróide, acumula as diferenças quadráticas feature a feature em
+    # matrizes contíguas (n_candidates, n_samples) e mantém o mínimo elemento a
+    # elemento; como a raiz é monotônica, ela é aplicada apenas ao mínimo final.
+    min_squared = None
+    for j in range(candidates.shape[1]):
+        squared = None
+        for feature in range(data.shape[1]):
+            diff = data[np.newaxis, :, feature] - candidates[:, j, feature, np.newaxis]
+            diff *= diff
+            if squared is None:
+                squared = diff
+            else:
+                squared += diff
+        if min_squared is None:
+            min_squared = squared
+        else:
+            np.minimum(min_squared, squared, out=min_squared)
+    return np.sum(np.sqrt(min_squared, out=min_squared), axis=1)
+
+
+def local_search(data, centroids, neighbors, mode="best", block_size=BLOCK_SIZE, move="product", evaluator=None,
+                 stopping=None):
     """
     Realiza a busca local para encontrar uma configuração melhor de centróides.
 
@@ -131,6 +553,17 @@ def local_search(data, centroids, neighbors, mode="best"):
     :param mode: Estratégia de busca local:
                  - 'first' para primeira melhora,
                  - 'best' para melhor melhora.
+    :param block_size: Quantidade de candidatos avaliados por passagem vetorizada.
+    :param move: Estrutura da vizinhança:
+                 - 'product' move todos os centróides (produto cartesiano das vizinhanças),
+                 - 'single' move um único centróide por vez, com custo incremental.
+    :param evaluator: Avaliador paralelo opcional (`src.paralelo.ParallelEvaluator`);
+                      quando informado, a varredura do modo 'best' com movimentos
+                      'product' é dividida entre vários processos.
+    :param stopping: Critérios de parada opcionais (`src.parada.StoppingCriteria`); a
+                     varredura é interrompida entre blocos quando o orçamento de
+                     avaliações ou o limite de tempo se esgota, e o motivo fica em
+                     `stopping.reason` ('completed' se a varredura terminar).
     :return: Uma tupla contendo:
         - best_centroids (np.ndarray): Melhor configuração de centróides.
         - best_cost (float): Menor soma de distâncias encontrada.
@@ -138,6 +571,9 @@ def local_search(data, centroids, neighbors, mode="best"):
     """
     if mode not in ("first", "best"):
         raise ValueError("Modo inválido. Use 'first' ou 'best'.")
+
+    if move not in ("product", "single"):
+        raise ValueError("Movimento inválido. Use 'product' ou 'single'.")
     
     if not isinstance(neighbors, np.ndarray) or neighbors.ndim != 3:
         raise ValueError("O array de vizinhanças deve ter formato (n_centroids, n_neighbors, n_features).")
@@ -146,65 +582,189 @@ def local_search(data, centroids, neighbors, mode="best"):
     best_centroids = centroids.copy()
     best_cost = compute_total_distance(data, centroids)
     history = [best_cost]
+    if stopping is not None:
+        stopping.start(best_cost)
 
-    # Gera todas as combinações possíveis de vizinhança (cartesian product)
-    neighbor_combinations = list(product(*[neighbors[i] for i in range(neighbors.shape[0])]))
-    
-    
-    # Embaralha a lista de combinações para evitar viés de ordem
-    random.shuffle(neighbor_combinations)
+    if move == "single":
+        result = _local_search_single(data, best_centroids, neighbors, mode, history)
+        return _finish(stopping, result)
+
+    # Espaço de combinações de vizinhança (produto cartesiano), endereçado por índice
+    space = NeighborhoodSpace(neighbors)
+
+    # Percorre as combinações em ordem aleatória para evitar viés de ordem,
+    # sem materializar a lista embaralhada
+    order = space.permutation(random.getrandbits(64))
+
+    if mode == "best" and evaluator is not None:
+        result = _local_search_parallel(evaluator, space, best_centroids, order, best_cost, history, stopping)
+        return _finish(stopping, result, counted=True)
+
+    blocks = (candidates for _, candidates in space.blocks(block_size, order=order))
 
     if mode == "first":
-        return _local_search_first(data, best_centroids, neighbor_combinations, best_cost, history)
+        result = _local_search_first(data, best_centroids, blocks, best_cost, history, stopping)
     else:  # mode == "best"
-        return _local_search_best(data, best_centroids, neighbor_combinations, best_cost, history)
+        result = _local_search_best(data, best_centroids, blocks, best_cost, history, stopping)
+    return _finish(stopping, result, counted=True)
+
+
+def _finish(stopping, result, counted=False):
+    """
+    Contabiliza as avaliações de uma varredura nos critérios de parada e registra
+    o fim natural da busca.
+
+    :param stopping: Critérios de parada (ou None).
+    :param result: Tupla (best_centroids, best_cost, history) da varredura.
+    :param counted: True se as avaliações já foram contabilizadas bloco a bloco.
+    :return: A própria tupla `result`.
+    """
+    if stopping is not None:
+        if not counted:
+            stopping.record(len(result[2]) - 1)
+        stopping.finish()
+    return result
 
 
-def _local_search_first(data, centroids, neighbor_combinations, best_cost, history):
+def _local_search_first(data, centroids, blocks, best_cost, history, stopping=None):
     """
     Realiza a busca local no modo 'first', retornando na primeira melhora encontrada.
 
+    Os candidatos são avaliados bloco a bloco; a busca para no primeiro bloco
+    que contém uma melhora e o histórico registra apenas os custos até ela.
+
     :param data: Dados de entrada.
     :param centroids: Centróides iniciais.
-    :param neighbor_combinations: Lista de todas as combinações possíveis de vizinhança.
+    :param blocks: Iterável de blocos (n_block, n_centroids, n_features) de combinações de vizinhança.
     :param best_cost: Custo da melhor configuração atual.
     :param history: Histórico de custos até o momento.
+    :param stopping: Critérios de parada opcionais, consultados a cada bloco.
     :return: Tupla (best_centroids, best_cost, history).
     """
     best_centroids = centroids.copy()
 
-    for combination in neighbor_combinations:
-        candidate_centroids = np.array(combination)
-        candidate_cost = compute_total_distance(data, candidate_centroids)
-        history.append(candidate_cost)
+    for block in blocks:
+        costs = compute_total_distances(data, block)
 
-        if candidate_cost < best_cost:
-            return candidate_centroids, candidate_cost, history  # Retorna na primeira melhora
+        improving = np.flatnonzero(costs < best_cost)
+        if improving.size:
+            first = improving[0]
+            history.extend(costs[:first + 1])
+            if stopping is not None:
+                stopping.record(first + 1)
+            return block[first].copy(), costs[first], history  # Retorna na primeira melhora
+
+        history.extend(costs)
+        if stopping is not None and stopping.record(len(costs)):
+            break  # Orçamento ou prazo esgotado: mantém a configuração atual
     
     # Se não houver melhora, retorna a configuração atual
     return best_centroids, best_cost, history
 
 
-def _local_search_best(data, centroids, neighbor_combinations, best_cost, history):
+def _local_search_best(data, centroids, blocks, best_cost, history, stopping=None):
     """
     Realiza a busca local no modo 'best', avaliando todas as combinações de vizinhos.
 
     :param data: Dados de entrada.
     :param centroids: Centróides iniciais.
-    :param neighbor_combinations: Lista de todas as combinações possíveis de vizinhança.
+    :param blocks: Iterável de blocos (n_block, n_centroids, n_features) de combinações de vizinhança.
     :param best_cost: Custo da melhor configuração atual.
     :param history: Histórico de custos até o momento.
+    :param stopping: Critérios de parada opcionais, consultados a cada bloco.
     :return: Tupla (best_centroids, best_cost, history).
     """
     best_centroids = centroids.copy()
 
-    for combination in neighbor_combinations:
-        candidate_centroids = np.array(combination)
-        candidate_cost = compute_total_distance(data, candidate_centroids)
-        history.append(candidate_cost)
+    for block in blocks:
+        costs = compute_total_distances(data, block)
+        history.extend(costs)
+
+        # argmin devolve a primeira ocorrência, preservando o desempate original
+        best_idx = np.argmin(costs)
+        if costs[best_idx] < best_cost:
+            best_cost = costs[best_idx]
+            best_centroids = block[best_idx].copy()
 
-        if candidate_cost < best_cost:
-            best_cost = candidate_cost
-            best_centroids = candidate_centroids
+        if stopping is not None and stopping.record(len(costs)):
+            break  # Orçamento ou prazo esgotado: devolve o melhor encontrado até aqui
 
     return best_centroids, best_cost, history
+
+
+def _local_search_parallel(evaluator, space, centroids, order, best_cost, history, stopping=None):
+    """
+    Realiza a busca local no modo 'best' com um avaliador paralelo.
+
+    Sem orçamento de avaliações nem limite de tempo, o espaço inteiro é dividido
+    entre os trabalhadores de uma só vez. Caso contrário, a varredura avança em
+    trechos de um bloco por trabalhador, e os critérios de parada são consultados
+    entre os trechos, como em `_local_search_best`.
+
+    :param evaluator: Avaliador paralelo (`src.paralelo.ParallelEvaluator`).
+    :param space: Espaço de combinações de vizinhança (NeighborhoodSpace).
+    :param centroids: Centróides iniciais.
+    :param order: Permutação (IndexPermutation) da ordem de varredura.
+    :param best_cost: Custo da melhor configuração atual.
+    :param history: Histórico de custos até o momento.
+    :param stopping: Critérios de parada opcionais, consultados a cada trecho.
+    :return: Tupla (best_centroids, best_cost, history).
+    """
+    best_centroids = centroids.copy()
+
+    chunk = len(space)
+    if stopping is not None and (stopping.max_evaluations is not None or stopping.time_limit is not None):
+        chunk = evaluator.n_workers * evaluator.block_size
+
+    for start in range(0, len(space), chunk):
+        costs, candidate = evaluator.scan(space.neighbors, order, start, min(start + chunk, len(space)))
+        history.extend(costs)
+
+        # Menor custo estrito: mantém o primeiro empate, como na varredura em um único trecho
+        if costs.min() < best_cost:
+            best_cost = costs.min()
+            best_centroids = candidate.copy()
+
+        if stopping is not None and stopping.record(len(costs)):
+            break  # Orçamento ou prazo esgotado: devolve o melhor encontrado até aqui
+
+    return best_centroids, best_cost, history
+
+
+def _local_search_single(data, centroids, neighbors, mode, history):
+    """
+    Realiza a busca local movendo um único centróide por vez.
+
+    Os custos de todos os movimentos são obtidos de forma incremental por um
+    `CostState`, sem recalcular a matriz de distâncias completa por candidato.
+    A ordem de varredura é embaralhada, como no modo 'product'.
+
+    :param data: Dados de entrada.
+    :param centroids: Centróides iniciais.
+    :param neighbors: Array de vizinhanças (n_centroids, n_neighbors, n_features).
+    :param mode: 'first' para primeira melhora ou 'best' para melhor melhora.
+    :param history: Histórico de custos até o momento.
+    :return: Tupla (best_centroids, best_cost, history).
+    """
+    state = CostState(data, centroids)
+    best_cost = state.cost
+    n_centroids, n_neighbors, _ = neighbors.shape
+
+    # Custos de todos os movimentos (centróide, vizinho), achatados na ordem de varredura
+    costs = np.concatenate([state.move_costs(i, neighbors[i]) for i in range(n_centroids)])
+    order = list(range(len(costs)))
+    random.shuffle(order)
+    costs = costs[order]
+
+    improving = np.flatnonzero(costs < best_cost)
+    if improving.size == 0:
+        history.extend(costs)
+        return centroids.copy(), best_cost, history
+
+    chosen = improving[0] if mode == "first" else improving[np.argmin(costs[improving])]
+    history.extend(costs[:chosen + 1] if mode == "first" else costs)
+
+    index, neighbor = divmod(order[chosen], n_neighbors)
+    best_centroids = centroids.copy()
+    best_centroids[index] = neighbors[index, neighbor]
+    return best_centroids, costs[chosen], history
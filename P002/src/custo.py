@@ -0,0 +1,210 @@
+import numpy as np
+
+# Heurística de cruzamento: acima destes limites a consulta ao centróide mais próximo
+# usa uma KD-tree sobre os centróides em vez da matriz completa de distâncias
+KDTREE_MIN_CENTROIDS = 48
+KDTREE_MIN_SAMPLES = 256
+KDTREE_MAX_FEATURES = 8
+
+
+def use_spatial_index(n_samples, n_centroids, n_features):
+    """
+    Decide se a consulta ao centróide mais próximo deve usar a KD-tree.
+
+    A força bruta custa O(n·k·d) e vence para poucos centróides; a KD-tree custa
+    O(k log k) para ser construída e cerca de O(log k) por ponto, mas perde
+    eficiência em dimensões altas.
+
+    :param n_samples: Quantidade de pontos consultados.
+    :param n_centroids: Quantidade de centróides.
+    :param n_features: Dimensão do espaço.
+    :return: True se a KD-tree deve ser usada.
+    """
+    return (n_centroids >= KDTREE_MIN_CENTROIDS
+            and n_samples >= KDTREE_MIN_SAMPLES
+            and n_features <= KDTREE_MAX_FEATURES)
+
+
+def pairwise_distances(points, centroids):
+    """
+    Matriz de distâncias euclidianas (n_points, n_centroids), acumulando os
+    quadrados feature a feature em vez de reduzir o eixo curto de features.
+
+    :param points: Pontos no formato (n_points, n_features).
+    :param centroids: Centróides no formato (n_centroids, n_features).
+    :return: Matriz (n_points, n_centroids) de distâncias.
+    """
+    squared = np.zeros((points.shape[0], centroids.shape[0]))
+    for feature in range(points.shape[1]):
+        diff = points[:, feature, np.newaxis] - centroids[np.newaxis, :, feature]
+        diff *= diff
+        squared += diff
+    return np.sqrt(squared, out=squared)
+
+
+def nearest_centroids(data, centroids, n_nearest=1, method="auto"):
+    """
+    Consulta os centróides mais próximos de cada ponto.
+
+    :param data: Pontos no formato (n_samples, n_features).
+    :param centroids: Centróides no formato (n_centroids, n_features).
+    :param n_nearest: Quantidade de vizinhos por ponto (1 ou 2).
+    :param method: 'brute' (matriz completa), 'kdtree' (índice espacial sobre os
+                   centróides) ou 'auto' (escolhe por `use_spatial_index`).
+    :return: Tupla (distances, labels). Com n_nearest=1, ambos têm formato
+             (n_samples,); com n_nearest=2, formato (n_samples, 2), ordenados do
+             mais próximo para o segundo mais próximo.
+    """
+    if method not in ("auto", "brute", "kdtree"):
+        raise ValueError("Método inválido. Use 'auto', 'brute' ou 'kdtree'.")
+    if n_nearest not in (1, 2) or n_nearest > centroids.shape[0]:
+        raise ValueError("n_nearest deve ser 1 ou 2 e não pode exceder a quantidade de centróides.")
+
+    if method == "auto":
+        method = "kdtree" if use_spatial_index(data.shape[0], *centroids.shape) else "brute"
+
+    if method == "kdtree":
+        # Importado apenas quando necessário: o scipy.spatial é caro de carregar
+        from scipy.spatial import cKDTree
+        distances, labels = cKDTree(centroids).query(data, k=n_nearest)
+        return distances, labels.astype(np.intp)
+
+    distances = pairwise_distances(data, centroids)
+    rows = np.arange(data.shape[0])
+    best = np.argmin(distances, axis=1)
+    best_dist = distances[rows, best]
+    if n_nearest == 1:
+        return best_dist, best
+
+    distances[rows, best] = np.inf
+    second = np.argmin(distances, axis=1)
+    return (np.column_stack([best_dist, distances[rows, second]]),
+            np.column_stack([best, second]))
+
+
+class CostState:
+    """
+    Estado de custo incremental para uma configuração de centróides.
+
+    Mantém, para cada ponto, a distância e o índice do centróide mais próximo e
+    do segundo mais próximo. Com isso, o custo exato de mover um único centróide
+    é obtido em O(n) sem recalcular a matriz de distâncias n×k, e o movimento
+    pode ser aplicado atualizando apenas os pontos afetados.
+
+    Attributes:
+        data (np.ndarray): Dados de entrada no formato (n_samples, n_features).
+        centroids (np.ndarray): Centróides atuais no formato (n_centroids, n_features).
+        best_dist (np.ndarray): Distância de cada ponto ao centróide mais próximo.
+        best_label (np.ndarray): Índice do centróide mais próximo de cada ponto.
+        second_dist (np.ndarray): Distância de cada ponto ao segundo centróide mais próximo.
+        second_label (np.ndarray): Índice do segundo centróide mais próximo (-1 se k = 1).
+        cost (float): Soma das distâncias dos pontos aos centróides mais próximos.
+    """
+    __slots__ = ['data', 'centroids', 'best_dist', 'best_label', 'second_dist', 'second_label', 'cost']
+
+    def __init__(self, data, centroids):
+        """
+        Construtor da classe CostState.
+
+        :param data: Dados de entrada no formato (n_samples, n_features).
+        :param centroids: Centróides iniciais no formato (n_centroids, n_features).
+        """
+        self.data = data
+        self.centroids = np.array(centroids, dtype=float)
+
+        n_samples = data.shape[0]
+        self.best_dist = np.empty(n_samples)
+        self.best_label = np.empty(n_samples, dtype=np.intp)
+        self.second_dist = np.empty(n_samples)
+        self.second_label = np.empty(n_samples, dtype=np.intp)
+
+        self._refresh(np.arange(n_samples))
+        self.cost = np.sum(self.best_dist)
+
+    def _refresh(self, rows):
+        """
+        Recalcula o mais próximo e o segundo mais próximo para as linhas informadas
+        (por força bruta ou KD-tree, conforme `nearest_centroids`).
+
+        :param rows: Índices dos pontos a serem recalculados.
+        """
+        if rows.size == 0:
+            return
+
+        if self.centroids.shape[0] == 1:
+            self.best_dist[rows], self.best_label[rows] = nearest_centroids(self.data[rows], self.centroids)
+            self.second_label[rows] = -1
+            self.second_dist[rows] = np.inf
+            return
+
+        distances, labels = nearest_centroids(self.data[rows], self.centroids, n_nearest=2)
+        self.best_dist[rows], self.second_dist[rows] = distances[:, 0], distances[:, 1]
+        self.best_label[rows], self.second_label[rows] = labels[:, 0], labels[:, 1]
+
+    def move_costs(self, index, positions):
+        """
+        Calcula o custo total exato resultante de mover um único centróide
+        para cada uma das posições candidatas.
+
+        Pontos cujo mais próximo é o centróide movido passam a usar o mínimo entre
+        a segunda melhor distância e a distância à nova posição; os demais usam o
+        mínimo entre a melhor distância atual e a distância à nova posição.
+
+        :param index: Índice do centróide a ser movido.
+        :param positions: Posições candidatas no formato (n_positions, n_features)
+                          ou uma única posição (n_features,).
+        :return: Vetor (n_positions,) com o custo de cada movimento, ou um float
+                 para uma única posição.
+        """
+        positions = np.asarray(positions, dtype=float)
+        single = positions.ndim == 1
+        positions = np.atleast_2d(positions)
+
+        new_dist = np.linalg.norm(self.data[np.newaxis, :, :] - positions[:, np.newaxis, :], axis=2)
+        fallback = np.where(self.best_label == index, self.second_dist, self.best_dist)
+        costs = np.sum(np.minimum(new_dist, fallback), axis=1)
+        return costs[0] if single else costs
+
+    def move_deltas(self, index, positions):
+        """
+        Calcula a variação de custo (delta) de mover um único centróide para cada
+        uma das posições candidatas. Valores negativos indicam melhora.
+
+        :param index: Índice do centróide a ser movido.
+        :param positions: Posições candidatas no formato (n_positions, n_features).
+        :return: Vetor (n_positions,) com os deltas de custo.
+        """
+        return self.move_costs(index, positions) - self.cost
+
+    def move(self, index, position):
+        """
+        Aplica o movimento de um único centróide, atualizando de forma incremental
+        as distâncias e rótulos por ponto.
+
+        Apenas os pontos que tinham o centróide movido como mais próximo ou segundo
+        mais próximo são recalculados contra todos os centróides; os demais apenas
+        comparam suas distâncias com a nova posição.
+
+        :param index: Índice do centróide a ser movido.
+        :param position: Nova posição do centróide (n_features,).
+        :return: O novo custo total.
+        """
+        position = np.asarray(position, dtype=float)
+        new_dist = np.linalg.norm(self.data - position, axis=1)
+        self.centroids[index] = position
+
+        stale = (self.best_label == index) | (self.second_label == index)
+        closer = ~stale & (new_dist < self.best_dist)
+        between = ~stale & ~closer & (new_dist < self.second_dist)
+
+        self.second_dist[closer] = self.best_dist[closer]
+        self.second_label[closer] = self.best_label[closer]
+        self.best_dist[closer] = new_dist[closer]
+        self.best_label[closer] = index
+
+        self.second_dist[between] = new_dist[between]
+        self.second_label[between] = index
+
+        self._refresh(np.flatnonzero(stale))
+        self.cost = np.sum(self.best_dist)
+        return self.cost
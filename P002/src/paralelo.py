@@ -0,0 +1,164 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from src.algoritmos import BLOCK_SIZE, compute_total_distances
+from src.vizinhanca import NeighborhoodSpace
+
+# Visão dos dados compartilhados no processo trabalhador (definida pelo inicializador)
+_shared_block = None
+_shared_data = None
+
+
+def _attach_shared_data(name, shape, dtype):
+    """
+    Inicializador dos processos trabalhadores: mapeia os dados da memória
+    compartilhada sem copiá-los nem recebê-los por pickle.
+    """
+    global _shared_block, _shared_data
+    _shared_block = shared_memory.SharedMemory(name=name)
+    _shared_data = np.ndarray(shape, dtype=dtype, buffer=_shared_block.buf)
+
+
+def _scan_shard(neighbors, start, stop, order, block_size):
+    """
+    Avalia as posições [start, stop) do espaço de vizinhança.
+
+    :return: Vetor com o custo de cada posição, na ordem de varredura.
+    """
+    space = NeighborhoodSpace(neighbors)
+    return np.concatenate([
+        compute_total_distances(_shared_data, candidates)
+        for _, candidates in space.blocks(block_size, start, stop, order)
+    ])
+
+
+def _best_admissible_shard(neighbors, start, stop, global_best_cost, tabu_memory, block_size):
+    """
+    Procura, nas posições [start, stop), o candidato de menor custo que não é
+    tabu ou que satisfaz o critério de aspiração.
+
+    :return: Tupla (custo, índice da combinação), ou (inf, -1) se não houver candidato.
+    """
+    space = NeighborhoodSpace(neighbors)
+    best_cost, best_index = float('inf'), -1
+
+    for indices, candidates in space.blocks(block_size, start, stop):
+        costs = compute_total_distances(_shared_data, candidates)
+        for idx in np.argsort(costs, kind="stable"):
+            if costs[idx] >= best_cost:
+                break
+            if costs[idx] < global_best_cost or candidates[idx] not in tabu_memory:
+                best_cost, best_index = costs[idx], int(indices[idx])
+                break
+
+    return best_cost, best_index
+
+
+class ParallelEvaluator:
+    """
+    Avaliação da vizinhança em vários núcleos.
+
+    Os dados são copiados uma única vez para um bloco de memória compartilhada,
+    mapeado por todos os processos do pool. A cada chamada, o espaço de combinações
+    é dividido em faixas contíguas (uma por trabalhador, ver `NeighborhoodSpace.shards`);
+    cada trabalhador devolve apenas o resultado reduzido da sua faixa, e os
+    resultados são combinados na ordem das faixas, reproduzindo a varredura sequencial.
+
+    Deve ser usado como gerenciador de contexto (ou encerrado com `close`) para
+    liberar o pool e a memória compartilhada.
+
+    Attributes:
+        n_workers (int): Quantidade de processos trabalhadores.
+        block_size (int): Quantidade de candidatos avaliados por passagem vetorizada.
+    """
+    __slots__ = ['n_workers', 'block_size', '_shared', '_executor']
+
+    def __init__(self, data, n_workers=None, block_size=BLOCK_SIZE):
+        """
+        Construtor da classe ParallelEvaluator.
+
+        :param data: Dados de entrada no formato (n_samples, n_features).
+        :param n_workers: Quantidade de processos (padrão: None, todos os núcleos).
+        :param block_size: Quantidade de candidatos avaliados por passagem vetorizada.
+        """
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.block_size = block_size
+
+        data = np.ascontiguousarray(data, dtype=float)
+        self._shared = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        np.ndarray(data.shape, dtype=data.dtype, buffer=self._shared.buf)[...] = data
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_attach_shared_data,
+            initargs=(self._shared.name, data.shape, data.dtype),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Encerra o pool de processos e libera a memória compartilhada.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._shared.close()
+            self._shared.unlink()
+
+    def scan(self, neighbors, order=None, start=0, stop=None):
+        """
+        Calcula o custo das combinações de vizinhança nas posições [start, stop)
+        da ordem de varredura (por padrão, de todas).
+
+        :param neighbors: Array de vizinhanças (n_centroids, n_neighbors, n_features).
+        :param order: Permutação opcional (IndexPermutation) da ordem de varredura.
+        :param start: Primeira posição avaliada (padrão: 0).
+        :param stop: Posição final, exclusiva (padrão: todo o espaço).
+        :return: Tupla (costs, candidate): vetor de custos na ordem de varredura e a
+                 combinação de menor custo (primeira ocorrência em caso de empate).
+        """
+        space = NeighborhoodSpace(neighbors)
+        futures = [
+            self._executor.submit(_scan_shard, neighbors, shard_start, shard_stop, order, self.block_size)
+            for shard_start, shard_stop in space.shards(self.n_workers, start, stop)
+        ]
+        costs = np.concatenate([future.result() for future in futures])
+
+        position = start + int(np.argmin(costs))
+        index = position if order is None else int(order.take(np.array([position]))[0])
+        return costs, space[index]
+
+    def best_admissible(self, neighbors, global_best_cost, tabu_memory):
+        """
+        Busca "melhor melhora" com lista tabu e aspiração, como em
+        `_best_improvement_search`, dividindo o espaço entre os trabalhadores.
+
+        :param neighbors: Array de vizinhanças (n_centroids, n_neighbors, n_features).
+        :param global_best_cost: Melhor custo global conhecido (usado na aspiração).
+        :param tabu_memory: Memória tabu (TabuMemory).
+        :return: Tupla (best_candidate, best_candidate_cost); o candidato é None
+                 se nenhum satisfizer as condições.
+        """
+        space = NeighborhoodSpace(neighbors)
+        futures = [
+            self._executor.submit(_best_admissible_shard, neighbors, start, stop,
+                                  global_best_cost, tabu_memory, self.block_size)
+            for start, stop in space.shards(self.n_workers)
+        ]
+
+        # Faixas em ordem: o menor custo estrito mantém o primeiro empate, como na varredura sequencial
+        best_cost, best_index = float('inf'), -1
+        for future in futures:
+            cost, index = future.result()
+            if cost < best_cost:
+                best_cost, best_index = cost, index
+
+        if best_index < 0:
+            return None, best_cost
+        return space[best_index].copy(), best_cost
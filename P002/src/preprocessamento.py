@@ -1,13 +1,54 @@
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler, StandardScaler
+import hashlib
+import os
+import numpy as np
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
-def preprocess_data(data: pd.DataFrame, features: list):
+# Este módulo é mantido idêntico em P002/src/preprocessamento.py e em
+# p003/processamento.py: qualquer correção deve ser aplicada aos dois arquivos.
+
+# Colunas da base Wine (UCI)
+WINE_COLUMNS = [
+    'Class', 'Alcohol', 'Malic_Acid', 'Ash', 'Alcalinity_of_Ash',
+    'Magnesium', 'Total_Phenols', 'Flavanoids', 'Nonflavanoid_Phenols',
+    'Proanthocyanins', 'Color_Intensity', 'Hue',
+    'OD280/OD315_of_Diluted_Wines', 'Proline'
+]
+
+# Normalizadores suportados pelo cache
+SCALERS = ("standard", "minmax")
+
+# Versão do formato dos arquivos de cache (entra na chave)
+CACHE_VERSION = 1
+
+# Tamanho dos trechos lidos ao calcular o hash do arquivo de origem
+_HASH_CHUNK = 1 << 20
+
+
+def load_data(file_path: str, columns: Sequence[str] = WINE_COLUMNS, header: Optional[int] = None):
+    """
+    Carrega o arquivo CSV e define os nomes das colunas.
+
+    Args:
+        file_path (str): Caminho do arquivo CSV.
+        columns (Sequence[str]): Nomes das colunas.
+        header (Optional[int]): Linha tratada como cabeçalho e descartada (None = o
+            arquivo não tem cabeçalho).
+
+    Returns:
+        pd.DataFrame: Dados carregados com colunas nomeadas.
+    """
+    import pandas as pd
+    return pd.read_csv(file_path, header=header, names=list(columns))
+
+
+def preprocess_data(data, features: list, scaler: str = "standard"):
     """
     Prepara os dados para análise, selecionando características específicas e normalizando.
 
     Args:
         data (pd.DataFrame): Dados de entrada no formato de DataFrame.
         features (list): Lista de nomes das colunas a serem usadas.
+        scaler (str): Normalizador: 'standard' (StandardScaler) ou 'minmax' (MinMaxScaler).
 
     Returns:
         tuple: Dados normalizados (np.ndarray) e o objeto scaler usado para normalização.
@@ -15,8 +56,165 @@ def preprocess_data(data: pd.DataFrame, features: list):
     # Seleciona as características escolhidas pelo usuário
     reduced_data = data[features]
 
-    # Normaliza os dados usando o StandardScaler
-    scaler = StandardScaler()
+    # Normaliza os dados com o normalizador escolhido
+    scaler = _new_scaler(scaler)
     normalized_data = scaler.fit_transform(reduced_data)
 
     return normalized_data, scaler
+
+
+class FittedScaler:
+    """
+    Parâmetros de um scaler já ajustado, lidos do cache sem importar pandas
+    nem scikit-learn.
+
+    Aplica a mesma transformação afim do scaler original:
+    'standard' faz (x - mean_) / scale_ e 'minmax' faz x * scale_ + min_.
+
+    Attributes:
+        kind (str): 'standard' ou 'minmax'.
+        params (Dict[str, np.ndarray]): Atributos ajustados do scaler original
+            (mean_, scale_, min_, ...), também acessíveis como atributos.
+    """
+
+    def __init__(self, kind: str, params: Dict[str, np.ndarray]) -> None:
+        """
+        Inicializa os parâmetros da normalização.
+
+        Args:
+            kind: 'standard' ou 'minmax'.
+            params: Atributos ajustados do scaler original.
+        """
+        self.kind = kind
+        self.params = params
+
+    def __getattr__(self, name: str):
+        try:
+            return self.__dict__["params"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Normaliza os dados com os parâmetros ajustados.
+        """
+        X = np.asarray(X, dtype=float)
+        if self.kind == "standard":
+            return (X - self.mean_) / self.scale_
+        return X * self.scale_ + self.min_
+
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Desfaz a normalização, voltando à escala original.
+        """
+        X = np.asarray(X, dtype=float)
+        if self.kind == "standard":
+            return X * self.scale_ + self.mean_
+        return (X - self.min_) / self.scale_
+
+    def to_sklearn(self):
+        """
+        Reconstrói o scaler equivalente do scikit-learn.
+        """
+        fitted = _new_scaler(self.kind)
+        for name, value in self.params.items():
+            setattr(fitted, name, value.astype(object) if name == "feature_names_in_" else value)
+        return fitted
+
+
+def load_preprocessed(file_path: str, features: Sequence[str], columns: Sequence[str] = WINE_COLUMNS,
+                      header: Optional[int] = None, scaler: str = "standard",
+                      cache_dir: Optional[str] = None) -> Tuple[np.ndarray, FittedScaler]:
+    """
+    Carrega os dados já selecionados e normalizados, usando um cache binário.
+
+    Na primeira execução, o arquivo é lido com pandas e normalizado; a matriz
+    resultante é gravada em um `.npy` e os parâmetros do scaler em um `.npz`.
+    Nas execuções seguintes (e nos processos trabalhadores), a matriz é mapeada
+    em memória, somente leitura e sem cópia, e os parâmetros do scaler são lidos
+    em um `FittedScaler`, sem importar pandas nem scikit-learn.
+
+    A chave do cache é o hash do conteúdo do arquivo de origem, das colunas, das
+    características, do cabeçalho e do tipo de scaler: qualquer alteração em um
+    deles gera um novo cache.
+
+    Args:
+        file_path: Caminho do arquivo CSV.
+        features: Nomes das colunas a serem usadas.
+        columns: Nomes das colunas do arquivo.
+        header: Linha tratada como cabeçalho e descartada (None = sem cabeçalho).
+        scaler: 'standard' ou 'minmax'.
+        cache_dir: Diretório do cache (padrão: `.cache` ao lado do arquivo de origem).
+
+    Returns:
+        Tupla (data, fitted): dados normalizados (np.ndarray somente leitura,
+        mapeado em memória) e o `FittedScaler` com os parâmetros da normalização.
+
+    Raises:
+        ValueError: Se o scaler for inválido.
+    """
+    if scaler not in SCALERS:
+        raise ValueError(f"Scaler inválido. Use um de {SCALERS}.")
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), ".cache")
+    base = os.path.join(cache_dir, _cache_key(file_path, features, columns, header, scaler))
+    data_path, scaler_path = base + ".npy", base + ".npz"
+
+    if not (os.path.exists(data_path) and os.path.exists(scaler_path)):
+        normalized_data, fitted = preprocess_data(load_data(file_path, columns, header), list(features), scaler)
+        os.makedirs(cache_dir, exist_ok=True)
+        _save_atomic(data_path, lambda f: np.save(f, np.ascontiguousarray(normalized_data, dtype=np.float64)))
+        _save_atomic(scaler_path, lambda f: np.savez(f, **_scaler_state(fitted)))
+
+    with np.load(scaler_path, allow_pickle=False) as state:
+        fitted = _restore_scaler(scaler, state)
+    return np.load(data_path, mmap_mode="r"), fitted
+
+
+def _cache_key(file_path: str, features: Sequence[str], columns: Sequence[str],
+               header: Optional[int], scaler: str) -> str:
+    """
+    Hash (hexadecimal) do conteúdo do arquivo de origem e dos parâmetros do pré-processamento.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source:
+        for chunk in iter(lambda: source.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    digest.update(repr((CACHE_VERSION, list(features), list(columns), header, scaler)).encode())
+    return digest.hexdigest()[:32]
+
+
+def _save_atomic(path: str, write: Callable) -> None:
+    """
+    Grava o arquivo em um temporário e o renomeia, para que execuções
+    simultâneas nunca leiam um cache incompleto.
+    """
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        write(f)
+    os.replace(temporary, path)
+
+
+def _new_scaler(scaler: str):
+    from sklearn.preprocessing import MinMaxScaler, StandardScaler
+    return StandardScaler() if scaler == "standard" else MinMaxScaler()
+
+
+def _scaler_state(fitted) -> Dict[str, np.ndarray]:
+    """
+    Parâmetros ajustados do scaler (atributos terminados em '_'), como arrays.
+    """
+    state = {name: np.asarray(value) for name, value in vars(fitted).items() if name.endswith("_")}
+    if "feature_names_in_" in state:
+        state["feature_names_in_"] = state["feature_names_in_"].astype(str)
+    return state
+
+
+def _restore_scaler(scaler: str, state) -> FittedScaler:
+    """
+    Lê os parâmetros do scaler gravados no cache.
+    """
+    params = {name: state[name] for name in state.files}
+    params = {name: value.item() if value.ndim == 0 else value for name, value in params.items()}
+    return FittedScaler(scaler, params)
@@ -1,6 +1,10 @@
 import numpy as np
-from itertools import product
+from collections import deque
 from src.utils import generate_neighbors
+from src.algoritmos import BLOCK_SIZE, compute_total_distances
+from src.parada import StoppingCriteria
+from src.custo import CostState, nearest_centroids
+from src.vizinhanca import NeighborhoodSpace
 
 def compute_total_distance(data, centroids):
     """
@@ -13,13 +17,135 @@ def compute_total_distance(data, centroids):
     Returns:
         float: Soma das distâncias para o conjunto de centróides fornecido.
     """
-    distances = np.linalg.norm(data[:, np.newaxis] - centroids, axis=2)
-    min_distances = np.min(distances, axis=1)
+    min_distances, _ = nearest_centroids(data, centroids)
     return np.sum(min_distances)
 
 
+class TabuMemory:
+    """
+    Memória tabu com consulta em O(1).
+
+    No modo 'solution', cada solução visitada é reduzida a uma chave canônica:
+    as coordenadas são quantizadas na resolução informada e os centróides são
+    ordenados, de modo que a mesma solução tenha a mesma chave independentemente
+    de ruído de ponto flutuante ou da ordem dos centróides. As chaves ficam em um
+    conjunto (hash) limitado por um buffer circular com as `size` mais recentes.
+
+    No modo 'attribute', o tabu recai sobre atributos de movimento: ao sair de
+    uma posição, o par (índice do centróide, posição quantizada) fica proibido
+    por `tenure` iterações, e qualquer candidato que recoloque aquele centróide
+    naquela posição é tabu.
+
+    Attributes:
+        size (int): Quantidade máxima de soluções lembradas (modo 'solution').
+        mode (str): 'solution' ou 'attribute'.
+        tenure (int): Permanência, em iterações, de cada atributo tabu (modo 'attribute').
+        resolution (float): Resolução usada para quantizar as coordenadas.
+    """
+    __slots__ = ['size', 'mode', 'tenure', 'resolution', '_keys', '_counts', '_attributes', '_expirations', '_clock']
+
+    def __init__(self, size=100, mode="solution", tenure=None, resolution=1e-6):
+        """
+        Construtor da classe TabuMemory.
+
+        :param size: Quantidade máxima de soluções lembradas (padrão: 100; 0 desativa a memória).
+        :param mode: 'solution' para soluções completas ou 'attribute' para
+                     posições por centróide (padrão: 'solution').
+        :param tenure: Permanência dos atributos tabu, em iterações
+                       (padrão: o próprio `size`).
+        :param resolution: Resolução de quantização das coordenadas (padrão: 1e-6).
+        """
+        if mode not in ("solution", "attribute"):
+            raise ValueError("Modo tabu inválido. Use 'solution' ou 'attribute'.")
+
+        self.size = size
+        self.mode = mode
+        self.tenure = size if tenure is None else tenure
+        self.resolution = resolution
+
+        # Modo 'solution': buffer circular + contagem das chaves presentes
+        self._keys = deque(maxlen=max(size, 0))
+        self._counts = {}
+
+        # Modo 'attribute': atributo -> iteração de expiração, em ordem de expiração
+        self._attributes = {}
+        self._expirations = deque()
+        self._clock = 0
+
+    def _quantize(self, centroids):
+        return np.round(np.asarray(centroids, dtype=float) / self.resolution).astype(np.int64)
+
+    def key(self, centroids):
+        """
+        Calcula a chave canônica de uma solução.
+
+        :param centroids: Centróides no formato (n_centroids, n_features).
+        :return: Chave (bytes) independente da ordem dos centróides.
+        """
+        lattice = self._quantize(centroids)
+        return lattice[np.lexsort(lattice.T[::-1])].tobytes()
+
+    def __contains__(self, centroids):
+        """
+        Indica se a solução é tabu.
+
+        :param centroids: Centróides no formato (n_centroids, n_features).
+        :return: True se a solução (ou algum de seus atributos) estiver na memória.
+        """
+        if self.mode == "solution":
+            return self.key(centroids) in self._counts
+
+        lattice = self._quantize(centroids)
+        return any((i, position.tobytes()) in self._attributes for i, position in enumerate(lattice))
+
+    def __len__(self):
+        return len(self._keys) if self.mode == "solution" else len(self._attributes)
+
+    def add(self, centroids, previous=None):
+        """
+        Registra a solução aceita na iteração corrente.
+
+        :param centroids: Centróides da nova solução corrente.
+        :param previous: Centróides da solução anterior; no modo 'attribute', as
+                         posições abandonadas tornam-se tabu.
+        """
+        if self.mode == "solution":
+            if self.size <= 0:
+                return  # Memória desativada: nenhuma solução é tabu
+            if self._keys and len(self._keys) == self.size:
+                self._forget(self._keys[0])
+            key = self.key(centroids)
+            self._keys.append(key)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            return
+
+        self._clock += 1
+        # Remove os atributos cuja permanência terminou
+        while self._expirations and self._expirations[0][0] <= self._clock:
+            expiration, attribute = self._expirations.popleft()
+            if self._attributes.get(attribute) == expiration:
+                del self._attributes[attribute]
+
+        if previous is None or self.tenure <= 0:
+            return
+
+        expiration = self._clock + self.tenure
+        current, before = self._quantize(centroids), self._quantize(previous)
+        for i in np.flatnonzero(np.any(current != before, axis=1)):
+            attribute = (int(i), before[i].tobytes())
+            self._attributes[attribute] = expiration
+            self._expirations.append((expiration, attribute))
+
+    def _forget(self, key):
+        count = self._counts[key] - 1
+        if count:
+            self._counts[key] = count
+        else:
+            del self._counts[key]
 
-def tabu_search(data, initial_centroids, neighbors, max_iter=100, tabu_size=100, delta=0.1, N_PASSOS=1):
+
+def tabu_search(data, initial_centroids, neighbors, max_iter=100, tabu_size=100, delta=0.1, N_PASSOS=1, move="product",
+                tabu_mode="solution", evaluator=None, stopping=None):
     """
     Implementa a busca tabu para minimizar o custo, utilizando busca local de
     melhor melhora (best improvement) a cada iteração.
@@ -29,9 +155,23 @@ def tabu_search(data, initial_centroids, neighbors, max_iter=100, tabu_size=100,
         initial_centroids (np.ndarray): Centróides iniciais (n_clusters, n_features).
         neighbors (np.ndarray): Vizinhanças dos centróides (n_clusters, n_neighbors, n_features).
         max_iter (int): Número máximo de iterações (default = 100).
-        tabu_size (int): Tamanho máximo da lista tabu (default = 100).
+        tabu_size (int): Tamanho máximo da lista tabu (default = 100). No modo
+            'attribute', é a permanência (tenure) de cada atributo, em iterações.
         delta (float): Parâmetro de variação para gerar novos vizinhos nas iterações subsequentes.
         N_PASSOS (int): Quantidade de passos/variações para cada centróide ao gerar nova vizinhança.
+        move (str): Estrutura da vizinhança: 'product' move todos os centróides a cada
+            iteração; 'single' move um único centróide, com custos e atualização
+            incrementais via `CostState`.
+        tabu_mode (str): 'solution' para tornar tabu as soluções visitadas ou
+            'attribute' para tornar tabu as posições abandonadas por cada centróide
+            (ver `TabuMemory`).
+        evaluator (ParallelEvaluator): Avaliador paralelo opcional (`src.paralelo`);
+            quando informado, a busca de melhor melhora do modo 'product' é dividida
+            entre vários processos.
+        stopping (StoppingCriteria): Critérios de parada opcionais (`src.parada`):
+            estagnação, melhora relativa mínima, orçamento de avaliações e limite de
+            tempo. Quando informado, substitui `max_iter`; o motivo da parada fica
+            em `stopping.reason`.
 
     Returns:
         tuple:
@@ -42,30 +182,50 @@ def tabu_search(data, initial_centroids, neighbors, max_iter=100, tabu_size=100,
     # Verificação básica do formato de neighbors
     if not isinstance(neighbors, np.ndarray) or neighbors.ndim != 3:
         raise ValueError("O array de vizinhanças deve ter formato (n_clusters, n_neighbors, n_features).")
+    if move not in ("product", "single"):
+        raise ValueError("Movimento inválido. Use 'product' ou 'single'.")
 
     # Inicializações
     current_centroids = initial_centroids.copy()
     best_centroids = current_centroids.copy()
     best_cost = compute_total_distance(data, current_centroids)
     current_cost = best_cost
-    tabu_list = []  # Lista tabu para registrar configurações recentes
+    tabu_memory = TabuMemory(size=tabu_size, mode=tabu_mode)  # Memória tabu das configurações recentes
     history = [best_cost]  # Histórico de custos
+    state = CostState(data, current_centroids) if move == "single" else None
+
+    # Critérios de parada: por padrão, apenas o limite de iterações
+    if stopping is None:
+        stopping = StoppingCriteria(max_iter=max_iter)
+    elif not stopping.is_bounded():
+        raise ValueError("Os critérios de parada devem limitar a busca (iterações, estagnação, avaliações ou tempo).")
+    stopping.start(best_cost)
 
-    for iter_idx in range(max_iter):
+    while not stopping.should_stop():
         # 1) Busca local: melhor melhora levando em conta a lista tabu
-        best_candidate, best_candidate_cost = _best_improvement_search(
-            data, neighbors, current_centroids, best_cost, tabu_list
-        )
+        if move == "single":
+            best_candidate, best_candidate_cost, best_move = _best_single_move_search(
+                state, neighbors, best_cost, tabu_memory
+            )
+        elif evaluator is not None:
+            best_candidate, best_candidate_cost = evaluator.best_admissible(neighbors, best_cost, tabu_memory)
+        else:
+            best_candidate, best_candidate_cost = _best_improvement_search(
+                data, neighbors, current_centroids, best_cost, tabu_memory
+            )
 
         # 2) Atualiza a solução corrente caso um candidato tenha sido encontrado
         if best_candidate is not None:
+            previous_centroids = current_centroids
             current_centroids = best_candidate
             current_cost = best_candidate_cost
 
-            # Adiciona a nova solução na lista tabu
-            tabu_list.append(current_centroids.tolist())
-            if len(tabu_list) > tabu_size:
-                tabu_list.pop(0)  # Remove o mais antigo se exceder tamanho
+            # No modo incremental, aplica o movimento sem recalcular o custo completo
+            if state is not None:
+                state.move(*best_move)
+
+            # Adiciona a nova solução na memória tabu (a mais antiga é descartada ao exceder o tamanho)
+            tabu_memory.add(current_centroids, previous=previous_centroids)
 
             # Atualiza a melhor solução global se houver melhora
             if current_cost < best_cost:
@@ -76,13 +236,17 @@ def tabu_search(data, initial_centroids, neighbors, max_iter=100, tabu_size=100,
         # 3) Armazena o custo da iteração no histórico
         history.append(current_cost)
 
-        # 4) Gera nova vizinhança baseada nos centróides atuais
+        # 4) Registra a iteração (candidatos da vizinhança avaliada) nos critérios de parada
+        n_centroids, n_neighbors, _ = neighbors.shape
+        stopping.update(best_cost, evaluations=n_centroids * n_neighbors if move == "single" else n_neighbors ** n_centroids)
+
+        # 5) Gera nova vizinhança baseada nos centróides atuais
         neighbors = generate_neighbors(current_centroids, delta=delta, N_PASSOS=N_PASSOS)
 
     return best_centroids, best_cost, history
 
 
-def _best_improvement_search(data, neighbors, global_best_cost, tabu_list):
+def _best_improvement_search(data, neighbors, current_centroids, global_best_cost, tabu_memory, block_size=BLOCK_SIZE):
     """
     Realiza a busca local “melhor melhora” (best improvement), avaliando todas
     as combinações de vizinhos, respeitando a lista tabu e aspiração.
@@ -92,7 +256,8 @@ def _best_improvement_search(data, neighbors, global_best_cost, tabu_list):
         neighbors (np.ndarray): Vizinhanças (n_clusters, n_neighbors, n_features).
         current_centroids (np.ndarray): Centróides da solução corrente.
         global_best_cost (float): Melhor custo global conhecido (usado na aspiração).
-        tabu_list (list): Lista tabu, contendo configurações recentemente visitadas.
+        tabu_memory (TabuMemory): Memória tabu, contendo configurações recentemente visitadas.
+        block_size (int): Quantidade de candidatos avaliados por passagem vetorizada.
 
     Returns:
         tuple:
@@ -103,20 +268,61 @@ def _best_improvement_search(data, neighbors, global_best_cost, tabu_list):
     best_candidate = None
     best_candidate_cost = float('inf')
 
-    # Cria todas as combinações dos vizinhos (produto cartesiano)
-    neighbor_combinations = list(product(*[neighbors[i] for i in range(neighbors.shape[0])]))
+    # Percorre o produto cartesiano dos vizinhos em blocos, sem materializá-lo
+    space = NeighborhoodSpace(neighbors)
+
+    for _, candidates in space.blocks(block_size):
+        costs = compute_total_distances(data, candidates)
+
+        # Dentro do bloco, testa os candidatos do menor para o maior custo; o primeiro
+        # que satisfaz a lista tabu (ou a aspiração) é o melhor do bloco
+        for idx in np.argsort(costs, kind="stable"):
+            candidate_cost = costs[idx]
+            if candidate_cost >= best_candidate_cost:
+                break
 
-    for combination in neighbor_combinations:
-        candidate_centroids = np.array(combination)
-        candidate_cost = compute_total_distance(data, candidate_centroids)
+            candidate_centroids = candidates[idx]
 
-        # Critério de aspiração: se a solução melhora global_best_cost,
-        # ela pode ser escolhida mesmo se estiver na lista tabu.
-        # Caso contrário, deve estar fora da tabu_list.
-        if candidate_cost < global_best_cost or candidate_centroids.tolist() not in tabu_list:
-            # Verifica se este candidato é a melhor opção até agora
-            if candidate_cost < best_candidate_cost:
+            # Critério de aspiração: se a solução melhora global_best_cost,
+            # ela pode ser escolhida mesmo se estiver na lista tabu.
+            # Caso contrário, deve estar fora da memória tabu.
+            if candidate_cost < global_best_cost or candidate_centroids not in tabu_memory:
                 best_candidate = candidate_centroids.copy()
                 best_candidate_cost = candidate_cost
+                break
 
     return best_candidate, best_candidate_cost
+
+
+def _best_single_move_search(state, neighbors, global_best_cost, tabu_memory):
+    """
+    Realiza a busca “melhor melhora” sobre movimentos de um único centróide,
+    usando os custos incrementais do `CostState`, respeitando a lista tabu e
+    aspiração.
+
+    Args:
+        state (CostState): Estado de custo da solução corrente.
+        neighbors (np.ndarray): Vizinhanças (n_clusters, n_neighbors, n_features).
+        global_best_cost (float): Melhor custo global conhecido (usado na aspiração).
+        tabu_memory (TabuMemory): Memória tabu, contendo configurações recentemente visitadas.
+
+    Returns:
+        tuple:
+            - best_candidate (np.ndarray or None): Melhor candidato encontrado
+              ou None se nenhum satisfizer as condições.
+            - best_candidate_cost (float): Custo do melhor candidato (ou inf se None).
+            - best_move (tuple or None): Par (índice do centróide, nova posição).
+    """
+    n_centroids, n_neighbors, _ = neighbors.shape
+    costs = np.concatenate([state.move_costs(i, neighbors[i]) for i in range(n_centroids)])
+
+    # Percorre os movimentos do menor para o maior custo; o primeiro admissível é o melhor
+    for flat_idx in np.argsort(costs, kind="stable"):
+        index, neighbor = divmod(int(flat_idx), n_neighbors)
+        candidate_centroids = state.centroids.copy()
+        candidate_centroids[index] = neighbors[index, neighbor]
+
+        if costs[flat_idx] < global_best_cost or candidate_centroids not in tabu_memory:
+            return candidate_centroids, costs[flat_idx], (index, neighbors[index, neighbor])
+
+    return None, float('inf'), None
@@ -1,4 +1,30 @@
 import numpy as np
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def neighbor_stencil(delta, N_PASSOS, n_features):
+    """
+    Calcula (uma única vez por combinação de parâmetros) os deslocamentos da vizinhança.
+
+    Args:
+        delta (float): Incremento para gerar vizinhanças.
+        N_PASSOS (int): Número de passos extras em cada direção.
+        n_features (int): Dimensão do espaço.
+
+    Returns:
+        np.ndarray: Array somente leitura (n_neighbors, n_features) com os deslocamentos,
+                    na ordem de `np.ndindex` e sem o deslocamento nulo.
+    """
+    steps = np.array([delta * i for i in range(-N_PASSOS, N_PASSOS + 1)])
+    grid = np.indices((len(steps),) * n_features).reshape(n_features, -1).T
+    offsets = steps[grid]
+
+    # Evitar o próprio centróide
+    offsets = offsets[~np.all(np.isclose(offsets, 0), axis=1)]
+    offsets.flags.writeable = False
+    return offsets
+
 
 def generate_neighbors(centroids, delta, N_PASSOS=1):
     """
@@ -20,18 +46,6 @@ def generate_neighbors(centroids, delta, N_PASSOS=1):
     if not isinstance(N_PASSOS, int) or N_PASSOS <= 0:
         raise ValueError("N_PASSOS deve ser um inteiro positivo.")
 
-    # Determinar os deslocamentos para gerar vizinhanças
-    steps = [delta * i for i in range(-N_PASSOS, N_PASSOS + 1)]
-
-    # Gerar vizinhanças para cada centróide
-    neighbors = []
-    for centroid in centroids:
-        centroid_neighbors = set()  # Usar set para evitar duplicatas
-        for displacement in np.ndindex(*([len(steps)] * centroids.shape[1])):
-            offset = np.array([steps[i] for i in displacement])
-            new_neighbor = tuple(centroid + offset)
-            if not np.allclose(offset, 0):  # Evitar o próprio centróide
-                centroid_neighbors.add(new_neighbor)
-        neighbors.append(np.array(list(centroid_neighbors)))
-
-    return np.array(neighbors)
+    # Deslocamentos pré-calculados, somados a todos os centróides de uma só vez
+    stencil = neighbor_stencil(delta, N_PASSOS, centroids.shape[1])
+    return centroids[:, np.newaxis, :] + stencil
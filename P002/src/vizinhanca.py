@@ -0,0 +1,193 @@
+import numpy as np
+
+# Maior espaço de combinações endereçável por índices inteiros de 64 bits
+MAX_SPACE_SIZE = 2 ** 62
+
+
+class IndexPermutation:
+    """
+    Permutação pseudoaleatória de `range(size)` calculada sob demanda.
+
+    Usa uma rede de Feistel balanceada sobre o menor domínio de potência de dois
+    que contém `size`, com cycle-walking para descartar valores fora do intervalo.
+    Assim, a i-ésima posição da permutação é obtida sem materializar a lista
+    embaralhada, e a mesma semente sempre produz a mesma ordem.
+
+    Attributes:
+        size (int): Tamanho do intervalo permutado.
+        half_bits (int): Quantidade de bits de cada metade da rede de Feistel.
+        keys (np.ndarray): Chaves de rodada derivadas da semente.
+    """
+    __slots__ = ['size', 'half_bits', 'keys']
+
+    _MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+    def __init__(self, size, seed=None, rounds=4):
+        """
+        Construtor da classe IndexPermutation.
+
+        :param size: Tamanho do intervalo a ser permutado.
+        :param seed: Semente do gerador das chaves de rodada.
+        :param rounds: Quantidade de rodadas da rede de Feistel (padrão: 4).
+        """
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self.half_bits = (bits + 1) // 2
+        self.keys = np.random.default_rng(seed).integers(0, 2 ** 32, size=rounds, dtype=np.uint64)
+
+    def __len__(self):
+        return self.size
+
+    def _encrypt(self, values):
+        """
+        Aplica a rede de Feistel a um vetor de valores do domínio estendido.
+
+        :param values: Vetor de inteiros sem sinal (np.uint64).
+        :return: Vetor permutado, no mesmo domínio estendido.
+        """
+        shift = np.uint64(self.half_bits)
+        mask = np.uint64((1 << self.half_bits) - 1)
+        left, right = values >> shift, values & mask
+        for key in self.keys:
+            mixed = (right + key) * self._MULTIPLIER
+            mixed ^= mixed >> np.uint64(29)
+            left, right = right, left ^ (mixed & mask)
+        return (left << shift) | right
+
+    def take(self, positions):
+        """
+        Retorna os índices permutados correspondentes às posições informadas.
+
+        :param positions: Posições (0 <= p < size) na ordem permutada.
+        :return: Vetor de índices (np.int64) do intervalo original.
+        """
+        values = self._encrypt(np.asarray(positions, dtype=np.uint64))
+        # Cycle-walking: reaplica a permutação aos valores que caíram fora do intervalo
+        outside = values >= self.size
+        while np.any(outside):
+            values[outside] = self._encrypt(values[outside])
+            outside = values >= self.size
+        return values.astype(np.int64)
+
+
+class NeighborhoodSpace:
+    """
+    Espaço de combinações de vizinhança endereçado por índice.
+
+    Cada combinação escolhe um vizinho para cada centróide e corresponde a um
+    inteiro em base mista (um dígito por centróide), na mesma ordem de
+    `itertools.product`. As combinações são decodificadas apenas quando
+    solicitadas, em blocos, de modo que a memória usada não depende do
+    tamanho do espaço.
+
+    Attributes:
+        neighbors (np.ndarray): Vizinhanças no formato (n_centroids, n_neighbors, n_features).
+        n_centroids (int): Quantidade de centróides.
+        n_neighbors (int): Quantidade de vizinhos por centróide.
+        size (int): Quantidade total de combinações (n_neighbors ** n_centroids).
+    """
+    __slots__ = ['neighbors', 'n_centroids', 'n_neighbors', 'size', '_strides']
+
+    def __init__(self, neighbors):
+        """
+        Construtor da classe NeighborhoodSpace.
+
+        :param neighbors: Array de vizinhanças (n_centroids, n_neighbors, n_features).
+        """
+        if not isinstance(neighbors, np.ndarray) or neighbors.ndim != 3:
+            raise ValueError("O array de vizinhanças deve ter formato (n_centroids, n_neighbors, n_features).")
+
+        self.neighbors = neighbors
+        self.n_centroids, self.n_neighbors, _ = neighbors.shape
+        self.size = self.n_neighbors ** self.n_centroids
+        if self.size > MAX_SPACE_SIZE:
+            raise ValueError("Espaço de combinações grande demais para ser endereçado; use movimentos de um único centróide.")
+
+        # O último centróide varia mais rápido, como em itertools.product
+        self._strides = self.n_neighbors ** np.arange(self.n_centroids - 1, -1, -1, dtype=np.int64)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        """
+        Retorna a combinação de centróides de um índice.
+
+        :param index: Índice da combinação (0 <= index < size).
+        :return: Array (n_centroids, n_features).
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("Índice de combinação fora do espaço de vizinhança.")
+        return self.take(np.array([index]))[0]
+
+    def decode(self, indices):
+        """
+        Converte índices de combinação em dígitos (índice do vizinho por centróide).
+
+        :param indices: Vetor de índices de combinação.
+        :return: Matriz (n_indices, n_centroids) com o vizinho escolhido por centróide.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        return (indices[:, np.newaxis] // self._strides) % self.n_neighbors
+
+    def take(self, indices):
+        """
+        Materializa apenas as combinações dos índices informados.
+
+        :param indices: Vetor de índices de combinação.
+        :return: Array (n_indices, n_centroids, n_features) com as configurações candidatas.
+        """
+        return self.neighbors[np.arange(self.n_centroids), self.decode(indices)]
+
+    def permutation(self, seed=None):
+        """
+        Cria uma ordem aleatória de varredura do espaço sem materializá-la.
+
+        :param seed: Semente da permutação.
+        :return: Instância de IndexPermutation sobre range(size).
+        """
+        return IndexPermutation(self.size, seed)
+
+    def shards(self, n_shards, start=0, stop=None):
+        """
+        Divide o espaço (ou as posições [start, stop)) em faixas contíguas de tamanhos equilibrados.
+
+        :param n_shards: Quantidade de faixas desejada.
+        :param start: Primeira posição dividida (padrão: 0).
+        :param stop: Posição final, exclusiva (padrão: size).
+        :return: Lista de tuplas (start, stop), uma por faixa não vazia.
+
+        Os limites são calculados com inteiros do Python, exatos em todo o espaço
+        endereçável (até MAX_SPACE_SIZE):
+
+        >>> space = NeighborhoodSpace(np.zeros((62, 2, 1)))
+        >>> space.shards(4, 2 ** 61 + 1, 2 ** 61 + 8) == [
+        ...     (2 ** 61 + 1, 2 ** 61 + 3), (2 ** 61 + 3, 2 ** 61 + 5),
+        ...     (2 ** 61 + 5, 2 ** 61 + 7), (2 ** 61 + 7, 2 ** 61 + 8)]
+        True
+        >>> space.shards(3, 2 ** 62 - 10)[-1] == (2 ** 62 - 3, 2 ** 62)
+        True
+        """
+        start, stop = int(start), self.size if stop is None else int(stop)
+        quotient, remainder = divmod(max(stop - start, 0), n_shards)
+        # As `remainder` primeiras faixas recebem uma posição a mais
+        bounds = [start + i * quotient + min(i, remainder) for i in range(n_shards + 1)]
+        return [(first, last) for first, last in zip(bounds[:-1], bounds[1:]) if last > first]
+
+    def blocks(self, block_size, start=0, stop=None, order=None):
+        """
+        Percorre o espaço em blocos prontos para a avaliação vetorizada.
+
+        :param block_size: Quantidade máxima de combinações por bloco.
+        :param start: Primeira posição da varredura (padrão: 0).
+        :param stop: Posição final, exclusiva (padrão: size).
+        :param order: Permutação opcional (IndexPermutation); quando informada,
+                      as posições [start, stop) são lidas na ordem permutada.
+        :return: Gerador de tuplas (indices, candidates), em que `candidates`
+                 tem formato (n_block, n_centroids, n_features).
+        """
+        stop = self.size if stop is None else stop
+        for block_start in range(start, stop, block_size):
+            positions = np.arange(block_start, min(block_start + block_size, stop), dtype=np.int64)
+            indices = positions if order is None else order.take(positions)
+            yield indices, self.take(indices)
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Diretório dos arquivos de dados (data.csv e data_<Mês>.csv)
+DIRETORIO_DADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Diretório do cache colunar dos arquivos já convertidos
+DIRETORIO_CACHE = os.path.join(DIRETORIO_DADOS, '.cache')
+
+# Versão do formato do cache (entra na chave)
+VERSAO_CACHE = 1
+
+MESES = ['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+         'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro']
+
+# Tipos declarados na leitura: categorias para os textos repetidos (inclusive os
+# identificadores de cada armadilha, que se repetem a cada semana) e inteiros
+# pequenos para as contagens (Latitude e Longitude são lidas como float com
+# vírgula decimal diretamente pelo parser)
+TIPOS = {
+    'Ciclo': pd.CategoricalDtype(MESES, ordered=True),
+    'Município': 'category',
+    'Código do IBGE': 'int32',
+    'Ano': 'int16',
+    'Número da armadilha': 'int16',
+    'Ovos': 'int16',
+    'Latitude': 'float64',
+    'Longitude': 'float64',
+    'Resultado': pd.CategoricalDtype(['Negativa', 'Positiva']),
+    'Semana': 'int8',
+    'Link': 'category',
+    'Lat_lng': 'category',
+}
+
+
+def caminho_dados(mes=None):
+    """
+    Caminho do arquivo de dados de um mês (data_<Mês>.csv) ou do arquivo completo (data.csv).
+    """
+    return os.path.join(DIRETORIO_DADOS, f'data_{mes}.csv' if mes else 'data.csv')
+
+
+def ler_csv(caminho):
+    """
+    Lê um arquivo de armadilhas (separador ';' e vírgula decimal) com os tipos de TIPOS.
+
+    :param caminho: Caminho do arquivo CSV.
+    :return: DataFrame com Latitude e Longitude já numéricas.
+    """
+    return pd.read_csv(caminho, sep=';', decimal=',', dtype=TIPOS)
+
+
+def carregar_armadilhas(mes=None, caminho=None, usar_cache=True):
+    """
+    Carrega os dados das armadilhas, reaproveitando o cache colunar quando possível.
+
+    Na primeira leitura de um arquivo, o CSV é convertido com `ler_csv` e cada
+    coluna é gravada como um array binário em um `.npz` (categorias como códigos
+    inteiros mais a lista de categorias). As leituras seguintes montam o
+    DataFrame direto desses arrays, sem analisar texto. O cache é identificado
+    pelo hash do conteúdo do CSV, então é refeito sempre que o arquivo muda.
+
+    :param mes: Mês do arquivo data_<Mês>.csv (None = data.csv, com todos os meses).
+    :param caminho: Caminho de um arquivo específico (tem prioridade sobre `mes`).
+    :param usar_cache: Se False, sempre lê o CSV (e não grava o cache).
+    :return: DataFrame com os tipos de TIPOS.
+    """
+    caminho = caminho or caminho_dados(mes)
+    if not usar_cache:
+        return ler_csv(caminho)
+
+    with open(caminho, 'rb') as arquivo:
+        resumo = hashlib.sha256(arquivo.read())
+    resumo.update(repr((VERSAO_CACHE, sorted(map(str, TIPOS.items())))).encode())
+    nome = os.path.splitext(os.path.basename(caminho))[0]
+    caminho_cache = os.path.join(DIRETORIO_CACHE, f'{nome}.{resumo.hexdigest()[:16]}.npz')
+
+    if os.path.exists(caminho_cache):
+        return _ler_colunar(caminho_cache)
+
+    df = ler_csv(caminho)
+    os.makedirs(DIRETORIO_CACHE, exist_ok=True)
+    _gravar_colunar(df, caminho_cache)
+
+    # Remove as versões anteriores do cache deste arquivo
+    for antigo in os.listdir(DIRETORIO_CACHE):
+        if antigo.startswith(nome + '.') and os.path.join(DIRETORIO_CACHE, antigo) != caminho_cache:
+            os.remove(os.path.join(DIRETORIO_CACHE, antigo))
+    return df
+
+
+def _gravar_colunar(df, caminho):
+    """
+    Grava cada coluna do DataFrame como um array do `.npz` (sem pickle).
+    """
+    arrays, colunas = {}, []
+    for i, (nome, serie) in enumerate(df.items()):
+        chave = f'c{i}'
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            arrays[chave] = serie.cat.codes.to_numpy()
+            arrays[chave + '_categorias'] = np.asarray(serie.cat.categories, dtype=str)
+            colunas.append([nome, 'category', bool(serie.cat.ordered)])
+        elif serie.dtype.kind in 'biuf':
+            arrays[chave] = serie.to_numpy()
+            colunas.append([nome, str(serie.dtype), False])
+        else:
+            # Textos: valores como unicode de largura fixa e máscara dos ausentes
+            arrays[chave] = serie.fillna('').to_numpy(dtype=str)
+            arrays[chave + '_ausentes'] = serie.isna().to_numpy()
+            colunas.append([nome, str(serie.dtype), False])
+    arrays['colunas'] = np.array(json.dumps(colunas))
+
+    temporario = f'{caminho}.{os.getpid()}.tmp'
+    with open(temporario, 'wb') as arquivo:
+        np.savez(arquivo, **arrays)
+    os.replace(temporario, caminho)
+
+
+def _ler_colunar(caminho):
+    """
+    Monta o DataFrame a partir dos arrays gravados por `_gravar_colunar`.
+    """
+    with np.load(caminho, allow_pickle=False) as arrays:
+        dados = {}
+        for i, (nome, tipo, ordenada) in enumerate(json.loads(arrays['colunas'].item())):
+            valores = arrays[f'c{i}']
+            if tipo == 'category':
+                dados[nome] = pd.Categorical.from_codes(valores, arrays[f'c{i}_categorias'], ordered=ordenada)
+            elif f'c{i}_ausentes' in arrays.files:
+                dados[nome] = pd.Series(valores, dtype=object).mask(arrays[f'c{i}_ausentes']).astype(tipo)
+            else:
+                dados[nome] = valores
+    return pd.DataFrame(dados)
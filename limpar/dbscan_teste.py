@@ -1,12 +1,10 @@
 from sklearn.cluster import DBSCAN
-import pandas as pd
+from dados import carregar_armadilhas
 import numpy as np
 import matplotlib.pyplot as plt
 
 # Carregar e pré-processar os dados
-df = pd.read_csv('data/data_janeiro.csv', delimiter=';')
-df['Latitude'] = df['Latitude'].str.replace(',', '.').astype(float)
-df['Longitude'] = df['Longitude'].str.replace(',', '.').astype(float)
+df = carregar_armadilhas('Janeiro')
 
 # Normalizar as colunas (Latitude, Longitude e Ovos)
 coords = df[['Latitude', 'Longitude']].values
@@ -1,13 +1,9 @@
 from sklearn.cluster import KMeans
-import pandas as pd
+from dados import carregar_armadilhas
 import matplotlib.pyplot as plt
 
-# Carregar seus dados reais do CSV
-df = pd.read_csv('data/data_janeiro.csv', delimiter=';')  # Substitua pelo seu arquivo CSV
-
-# Corrigir a conversão de Latitude, Longitude e Número de Ovos para o formato correto
-df['Latitude'] = df['Latitude'].str.replace(',', '.').astype(float)
-df['Longitude'] = df['Longitude'].str.replace(',', '.').astype(float)
+# Carregar seus dados reais (Latitude e Longitude já convertidas pelo carregador)
+df = carregar_armadilhas('Janeiro')  # Substitua pelo mês desejado
 df['Ovos'] = df['Ovos'].astype(float)  # Certifique-se de que 'Ovos' seja numérico
 
 # Definir o número de clusters
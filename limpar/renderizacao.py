@@ -0,0 +1,94 @@
+from collections import namedtuple
+import numpy as np
+
+# Faixa de risco pela quantidade de ovos: limite superior (inclusivo), cor nos
+# gráficos, cor do ícone no folium, rótulo da legenda e nível de risco
+Faixa = namedtuple('Faixa', ['maximo', 'cor', 'cor_mapa', 'rotulo', 'risco'])
+
+FAIXAS_OVOS = [
+    Faixa(50, 'green', 'green', '0-50 ovos', 'Baixo risco'),
+    Faixa(100, 'yellow', 'lightred', '51-100 ovos', 'Risco moderado'),
+    Faixa(150, 'orange', 'orange', '101-150 ovos', 'Risco alto'),
+    Faixa(200, 'red', 'red', '151-200 ovos', 'Risco muito alto'),
+    Faixa(250, 'purple', 'purple', '201-250 ovos', 'Emergência'),
+    Faixa(300, 'blue', 'darkpurple', '251-300 ovos', 'Emergência extrema'),
+    Faixa(np.inf, 'darkviolet', 'black', '>300 ovos', 'Máxima emergência'),
+]
+
+# Limites superiores das faixas, para a classificação vetorizada
+_LIMITES = np.array([faixa.maximo for faixa in FAIXAS_OVOS[:-1]])
+
+
+def filtrar_semana(df, ciclo, semana):
+    """
+    Seleciona as leituras de um ciclo (mês) e de uma semana com máscaras booleanas.
+    """
+    return df[(df['Ciclo'] == ciclo).to_numpy() & (df['Semana'] == semana).to_numpy()]
+
+
+def classificar_ovos(ovos):
+    """
+    Índice da faixa de risco (em FAIXAS_OVOS) de cada quantidade de ovos.
+
+    :param ovos: Quantidades de ovos (Series ou array).
+    :return: Array de índices, de 0 (baixo risco) a len(FAIXAS_OVOS) - 1.
+    """
+    return np.searchsorted(_LIMITES, np.asarray(ovos), side='left')
+
+
+def cores_ovos(ovos, mapa=False):
+    """
+    Cor de cada quantidade de ovos, conforme a faixa de risco.
+
+    :param ovos: Quantidades de ovos (Series ou array).
+    :param mapa: Se True, usa as cores válidas para os ícones do folium.
+    :return: Array com a cor de cada ponto.
+    """
+    cores = np.array([faixa.cor_mapa if mapa else faixa.cor for faixa in FAIXAS_OVOS])
+    return cores[classificar_ovos(ovos)]
+
+
+def agrupar_por_faixa(ovos):
+    """
+    Agrupa os pontos por faixa de risco com uma única ordenação.
+
+    :param ovos: Quantidades de ovos (Series ou array).
+    :return: Lista de pares (faixa, índices dos pontos), para todas as faixas
+             (as faixas sem pontos recebem um array vazio).
+    """
+    classes = classificar_ovos(ovos)
+    ordem = np.argsort(classes, kind='stable')
+    inicios = np.searchsorted(classes[ordem], np.arange(len(FAIXAS_OVOS) + 1))
+    return [(faixa, ordem[inicios[i]:inicios[i + 1]]) for i, faixa in enumerate(FAIXAS_OVOS)]
+
+
+def plotar_faixas(ax, df, z=None, s=50, **kwargs):
+    """
+    Desenha as armadilhas coloridas pela faixa de risco: uma chamada de scatter
+    por faixa, já com o rótulo da legenda (inclusive para faixas vazias).
+
+    :param ax: Eixos do matplotlib (2D ou 3D).
+    :param df: Leituras com Longitude, Latitude e Ovos.
+    :param z: Coluna usada como terceira coordenada em eixos 3D (por exemplo 'Ovos').
+    :param s: Tamanho dos pontos.
+    :param kwargs: Demais argumentos repassados ao scatter.
+    """
+    x, y = df['Longitude'].to_numpy(), df['Latitude'].to_numpy()
+    coordenadas = (x, y) if z is None else (x, y, df[z].to_numpy())
+    for faixa, indices in agrupar_por_faixa(df['Ovos']):
+        ax.scatter(*(c[indices] for c in coordenadas), color=faixa.cor, s=s, label=faixa.rotulo, **kwargs)
+
+
+def plotar_resultados(ax, df, s=50):
+    """
+    Desenha as armadilhas positivas (verde) e negativas (vermelho), uma chamada
+    de scatter para cada resultado.
+
+    :param ax: Eixos do matplotlib.
+    :param df: Leituras com Longitude, Latitude e Resultado.
+    :param s: Tamanho dos pontos.
+    """
+    positiva = (df['Resultado'] == 'Positiva').to_numpy()
+    x, y = df['Longitude'].to_numpy(), df['Latitude'].to_numpy()
+    ax.scatter(x[positiva], y[positiva], color='green', s=s, label='Positiva- tem ovos')
+    ax.scatter(x[~positiva], y[~positiva], color='red', s=s, label='Negativa- não tem ovos')
@@ -1,54 +1,153 @@
 from __future__ import annotations
 import numpy as np
-from typing import Optional, List, Tuple
+from typing import ClassVar, Dict, Optional, List, Tuple
+from avaliacao import calcular_fitness
 
 class Individuo:
     """
     Representa um indivíduo da população para o algoritmo genético aplicado ao k-means.
     
     Cada indivíduo encapsula uma solução candidata para o problema de agrupamento,
-    consistindo em um conjunto de três centróides no plano cartesiano. O fitness
+    consistindo em um conjunto de k centróides de dimensão d. O cromossomo é
+    sempre um array float64 contíguo de formato (k, d). O fitness
     do indivíduo é calculado com base na soma das distâncias mínimas entre cada
     ponto do conjunto de dados e seu centróide mais próximo.
     
     Attributes:
-        individuo (np.ndarray): Array com formato (3, 1, 2) representando os três 
-                               centróides, onde cada centróide é do tipo [[x, y]].
-        fitness (float): Valor que quantifica a qualidade da solução (menor é melhor).
+        individuo (np.ndarray): Array float64 com formato (k, d), uma linha por centróide.
+        fitness (float): Valor que quantifica a qualidade da solução (menor é melhor),
+                         calculado sob demanda e invalidado quando o cromossomo muda.
+        contadores (Dict[str, int]): Avaliações sob demanda (`calculate_fitness`), recálculos
+                                     evitados (mutações sem efeito e cromossomos reatribuídos
+                                     sem alteração) e invalidações, somados entre todos os
+                                     indivíduos. As avaliações em lote (`calcular_fitness_lote`)
+                                     não passam por aqui; o total de passagens pela base é
+                                     `avaliacao.total_avaliacoes()`.
     """
-    def __init__(self, *, data: np.ndarray, individuo: Optional[np.ndarray] = None) -> None:
+    __slots__ = ['data', '_individuo', '_fitness']
+
+    # Quantidade padrão de centróides de um genoma vazio
+    N_CENTROIDES: ClassVar[int] = 3
+
+    # Contadores do ciclo de vida do fitness dos indivíduos (compartilhados por todos os indivíduos)
+    contadores: ClassVar[Dict[str, int]] = {"avaliacoes": 0, "poupadas": 0, "invalidacoes": 0}
+
+    def __init__(self, *, data: np.ndarray, individuo: Optional[np.ndarray] = None,
+                 n_centroides: Optional[int] = None) -> None:
         """
-        Inicializa um indivíduo com centróides e calcula seu fitness.
+        Inicializa um indivíduo com centróides. O fitness é calculado apenas
+        quando lido pela primeira vez.
         
         Args:
             data: Conjunto de dados utilizado para calcular o fitness, no formato
                  (n_samples, n_features).
-            individuo: Array com formato (3, 1, 2) representando os três centróides.
-                      Se None, inicializa com valores padrão que devem ser configurados
-                      posteriormente.
+            individuo: Centróides em qualquer formato com n_features na última dimensão,
+                      por exemplo (k, d) ou (k, 1, d); são convertidos para float64 (k, d).
+                      Se None, cria um genoma vazio (ver `vazio`).
+            n_centroides: Quantidade de centróides do genoma vazio (default: N_CENTROIDES).
         """
+        self.data = data
+        self._fitness: Optional[float] = None
         if individuo is not None:
             self.individuo = individuo
-            self.fitness = self.calculate_fitness(data)
         else:
-            # Inicializa com 3 centróides com valores None (devem ser configurados posteriormente)
-            self.individuo = np.array([[[None, None]],
-                                       [[None, None]],
-                                       [[None, None]]])
-        self.data = data
-        
+            # Genoma numérico preenchido com NaN (deve ser configurado posteriormente)
+            self.individuo = np.full((n_centroides or self.N_CENTROIDES, data.shape[1]), np.nan)
+
+    @classmethod
+    def vazio(cls, *, data: np.ndarray, n_centroides: Optional[int] = None) -> Individuo:
+        """
+        Cria um indivíduo com genoma vazio (float64 preenchido com NaN), pronto
+        para ter seus centróides escritos diretamente.
+
+        Args:
+            data: Conjunto de dados utilizado para calcular o fitness.
+            n_centroides: Quantidade de centróides (default: N_CENTROIDES).
+
+        Returns:
+            Novo indivíduo com fitness ainda não calculado.
+        """
+        return cls(data=data, n_centroides=n_centroides)
+
+    def copiar(self) -> Individuo:
+        """
+        Cria uma cópia independente do indivíduo: o genoma é copiado, o fitness em
+        cache é mantido e a base de dados é compartilhada (não é copiada).
+
+        Returns:
+            Novo indivíduo com o mesmo genoma e fitness.
+        """
+        copia = Individuo(data=self.data, individuo=self._individuo.copy())
+        copia._fitness = self._fitness
+        return copia
+
+    def __copy__(self) -> Individuo:
+        return self.copiar()
+
+    def __deepcopy__(self, memo: dict) -> Individuo:
+        # A base de dados é compartilhada por referência: apenas o genoma é duplicado
+        return self.copiar()
+
+    @property
+    def individuo(self) -> np.ndarray:
+        """
+        Array de centróides do indivíduo. Atribuir um array com outros valores invalida
+        o fitness; alterações feitas no próprio array devem ser seguidas de `invalidar_fitness`.
+        """
+        return self._individuo
+
+    @individuo.setter
+    def individuo(self, individuo: np.ndarray) -> None:
+        novo = np.ascontiguousarray(individuo, dtype=np.float64).reshape(-1, self.data.shape[1])
+        # Cromossomo reatribuído sem alteração: o fitness em cache continua válido
+        # (um array que compartilha memória com o atual pode ter sido alterado no lugar)
+        if (self._fitness is not None and not np.shares_memory(novo, self._individuo)
+                and np.array_equal(novo, self._individuo)):
+            self._individuo = novo
+            Individuo.contadores["poupadas"] += 1
+            return
+        self._individuo = novo
+        self.invalidar_fitness()
+
+    @property
+    def fitness(self) -> float:
+        """
+        Fitness do indivíduo, calculado sob demanda e mantido em cache até que
+        o cromossomo seja alterado.
+        """
+        if self._fitness is None:
+            return self.calculate_fitness(self.data)
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, fitness: float) -> None:
+        # Permite informar um fitness já conhecido (por exemplo, calculado em lote)
+        self._fitness = fitness
+
+    def invalidar_fitness(self) -> None:
+        """
+        Marca o fitness como desatualizado, para que seja recalculado na próxima leitura.
+        """
+        if self._fitness is not None:
+            Individuo.contadores["invalidacoes"] += 1
+            self._fitness = None
+
+    @classmethod
+    def zerar_contadores(cls) -> None:
+        """
+        Zera os contadores de avaliações de fitness.
+        """
+        for chave in cls.contadores:
+            cls.contadores[chave] = 0
 
     def set_individuo(self, individuo: np.ndarray) -> None:
         """
         Atualiza o array de centróides do indivíduo.
         
         Args:
-            individuo: Novo array de centróides com formato (3, 1, 2).
-                      Cada elemento representa as coordenadas de um centróide
-                      no formato [[x, y]].
+            individuo: Novo array de centróides com formato (k, d) (ou (k, 1, d)).
         """
         self.individuo = individuo
-        self.calculate_fitness(self.data)
 
     def calculate_fitness(self, data: np.ndarray) -> float:
         """
@@ -65,23 +164,12 @@ class Individuo:
         Returns:
             O valor de fitness calculado (soma das distâncias mínimas).
         """
-        # Para cada ponto, calcule a distância até todos os centróides e pegue a menor
-        distances_min_acomuladas = []
-
-        for ponto in data:
-            distances = []
-            for centroide in self.individuo:
-                # Calcula a distância euclidiana entre o ponto e o centróide
-                dist = np.linalg.norm(ponto - centroide)
-                distances.append(dist)
-            # Pega a menor distância (centróide mais próximo)
-            distances_min_acomuladas.append(min(distances))
-        
-        # O fitness é a soma de todas as distâncias mínimas
-        self.fitness= np.sum(distances_min_acomuladas)
-        return  self.fitness
+        # Distância de cada ponto ao centróide mais próximo, em uma única passagem vetorizada
+        self._fitness = calcular_fitness(data, self.individuo)
+        Individuo.contadores["avaliacoes"] += 1
+        return self._fitness
         
-    def mutate(self, dmax: float, prob_mutacao: float = 0.03) -> None:
+    def mutate(self, dmax: float, prob_mutacao: float = 0.03) -> bool:
         """
         Aplica o operador de mutação aos centróides do indivíduo.
         
@@ -89,17 +177,27 @@ class Individuo:
         aleatoriamente as coordenadas dos centróides. Cada centróide tem uma
         probabilidade `prob_mutacao` de sofrer mutação, e quando ocorre, suas
         coordenadas são alteradas por um valor aleatório no intervalo [-dmax, dmax].
+        O fitness só é invalidado se algum centróide foi de fato alterado.
         
         Args:
             dmax: Valor máximo de alteração para cada coordenada durante a mutação.
             prob_mutacao: Probabilidade de mutação para cada centróide (default: 0.03).
+
+        Returns:
+            True se algum centróide foi alterado.
         """
+        alterado = False
         for centroide in self.individuo:
             if np.random.rand() < prob_mutacao:
                 # Adiciona um valor aleatório no intervalo [-dmax, dmax] para cada coordenada
-                centroide += np.random.uniform(-dmax, dmax, size=2)
-            
-            self.calculate_fitness(self.data)
+                centroide += np.random.uniform(-dmax, dmax, size=centroide.shape[0])
+                alterado = True
+
+        if alterado:
+            self.invalidar_fitness()
+        elif self._fitness is not None:
+            Individuo.contadores["poupadas"] += 1  # Nenhum centróide alterado: o fitness continua válido
+        return alterado
             
 
     def tolist(self) -> str:
@@ -1,7 +1,8 @@
 from RecombinadorStrategy import RecombinadorStrategy
 from Individuo import Individuo
-from typing import ClassVar
+from typing import ClassVar, Tuple
 import numpy as np
+from avaliacao import calcular_fitness_lote
 
 
 
@@ -50,14 +51,21 @@ class MediaStrategy(RecombinadorStrategy):
         if self.dados is None:
             raise ValueError("É necessário definir os dados com set_dados() antes de recombinar indivíduos")
            
-        media_centroide_esquerda = (ind1.individuo[0] + ind2.individuo[0]) / 2
-        media_centroide_meio     = (ind1.individuo[1] + ind2.individuo[1]) / 2
-        media_centroide_direita  = (ind1.individuo[2] + ind2.individuo[2]) / 2
+        # Média de todos os centróides de uma só vez: Filho[i] = (ind1[i] + ind2[i]) / 2
+        filho = Individuo(data=self.dados, individuo=(ind1.individuo + ind2.individuo) / 2)
+        return filho
 
-        filho = Individuo(data=self.dados)
-        filho.individuo[0] = media_centroide_esquerda
-        filho.individuo[1] = media_centroide_meio
-        filho.individuo[2] = media_centroide_direita
+    def recombinar_lote(self, pais1: np.ndarray, pais2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recombina todos os pares de uma só vez: um filho por par, com a média
+        dos centróides correspondentes dos pais.
+
+        Args:
+            pais1: Cromossomos do primeiro pai de cada par, formato (n_pares, k, d).
+            pais2: Cromossomos do segundo pai de cada par, formato (n_pares, k, d).
 
-        filho.calculate_fitness(self.dados)
-        return filho
\ No newline at end of file
+        Returns:
+            Tupla (filhos, fitness), com formatos (n_pares, k, d) e (n_pares,).
+        """
+        filhos = (pais1 + pais2) / 2
+        return filhos, calcular_fitness_lote(self.dados, filhos)
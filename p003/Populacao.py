@@ -1,11 +1,9 @@
 
-import copy
-from traceback import print_tb
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from Individuo import Individuo
 from RecombinadorStrategy import RecombinadorStrategy
-import random
+from memetico import BuscaLocalMemetica
 
 class Populacao:
     """
@@ -20,6 +18,10 @@ class Populacao:
         dados (np.ndarray): Base de dados utilizada para o cálculo do fitness.
         individuos (List[Individuo]): Lista contendo os indivíduos da população atual.
         melhor_global (Individuo]: Melhor indivíduo encontrado até o momento.
+
+    A população é ordenada no máximo uma vez por geração: a ordem é reaproveitada
+    enquanto nenhum indivíduo for alterado, a elite é obtida por `np.argpartition`
+    e o melhor global é atualizado comparando apenas os indivíduos novos ou alterados.
     """
 
 
@@ -35,8 +37,10 @@ class Populacao:
         self.tamanho = tamanho
         self.dados = dados
         self.individuos: List[Individuo] = self._inicializar_populacao()
-        self.individuos.sort(key=lambda ind: ind.fitness)
-        self.melhor_global = copy.deepcopy(self.individuos[0])
+        # Indica se `individuos` está ordenada por fitness desde a última alteração
+        self._ordenada = False
+        self._ordenar()
+        self.melhor_global = self.individuos[0].copiar()
 
     def _inicializar_populacao(self) -> List[Individuo]:
         """
@@ -70,7 +74,7 @@ class Populacao:
         no espaço de busca bidimensional.
         
         Returns:
-            Array de centróides com formato (3, 1, 2), onde cada centróide
+            Array de centróides com formato (3, 2), onde cada centróide
             é representado por coordenadas (x, y).
         """
         centros = []
@@ -78,7 +82,7 @@ class Populacao:
             # Aqui definimos os limites do espaço (exemplo: entre 0 e 2)
             x = np.random.uniform(0, 2)
             y = np.random.uniform(0, 2)
-            centros.append([[x, y]])
+            centros.append([x, y])
         return np.array(centros)
 
     def _obter_solucao_anterior(self) -> List[Individuo]:
@@ -103,18 +107,40 @@ class Populacao:
 
 
     
-    def _set_melhor_individuo_global(self) -> None:
+    def _fitness_individuos(self) -> np.ndarray:
         """
-        Atualiza o melhor indivíduo global com base no melhor indivíduo atual.
+        Vetor com o fitness de cada indivíduo, na ordem atual da lista.
         """
-        self.individuos.sort(key=lambda ind: ind.fitness)
-        melhor_atual = copy.deepcopy(self.individuos[0])
-        
+        return np.fromiter((ind.fitness for ind in self.individuos), dtype=float, count=len(self.individuos))
+
+    def _ordenar(self) -> None:
+        """
+        Ordena os indivíduos pelo fitness, apenas se a ordem atual não for mais válida.
+        """
+        if not self._ordenada:
+            ordem = np.argsort(self._fitness_individuos(), kind="stable")
+            self.individuos = [self.individuos[i] for i in ordem]
+            self._ordenada = True
+
+    def _set_melhor_individuo_global(self, candidatos: Optional[List[Individuo]] = None) -> None:
+        """
+        Atualiza o melhor indivíduo global comparando-o com os candidatos informados.
+
+        Apenas indivíduos novos ou alterados podem superar o melhor global, então
+        cada candidato custa uma única comparação, sem reordenar a população.
+
+        Args:
+            candidatos: Indivíduos a comparar (default: toda a população).
+        """
+        melhor_atual = self.melhor_global
+        for individuo in (self.individuos if candidatos is None else candidatos):
+            if individuo.fitness < melhor_atual.fitness:
+                melhor_atual = individuo
 
-        if melhor_atual.fitness < self.melhor_global.fitness: 
-            self.melhor_global = copy.deepcopy(melhor_atual) 
+        # Cópia leve (genoma e fitness) apenas quando há melhora; os dados não são copiados
+        if melhor_atual is not self.melhor_global:
+            self.melhor_global = melhor_atual.copiar()
 
-            
     def selecionar_individuos(self) -> List[Individuo]:
         """
         Seleciona indivíduos para recombinação.
@@ -127,15 +153,15 @@ class Populacao:
         """
         # Ordena os indivíduos atuais pela qualidade (fitness)
         # Assim, ao gerar os filhos, sempre vão pegar os melhores pais primeiro
-        self.individuos.sort(key=lambda ind: ind.fitness)
+        self._ordenar()
         return self.individuos
 
     def recombinar(self, recombinador:RecombinadorStrategy) -> List[Individuo]:
         """
         Realiza a recombinação genética entre indivíduos para gerar novos indivíduos.
         
-        Utiliza o método de recombinação por troca de extremidades, aplicado a pares
-        consecutivos de indivíduos selecionados.
+        Aplica a estratégia de recombinação a pares consecutivos de indivíduos
+        selecionados, todos de uma vez, por meio de `recombinar_lote`.
 
         Args:
             recombinador: Estratégia de recombinação a ser utilizada.
@@ -143,21 +169,23 @@ class Populacao:
         Returns:
             Lista dos novos indivíduos (filhos) gerados pela recombinação.
         """
-        novos_individuos = []
-        
         pais = self.selecionar_individuos()
+        n_pares = len(pais) // 2
+
+        # Todos os pares consecutivos são recombinados e avaliados em uma única chamada
+        cromossomos = np.array([ind.individuo for ind in pais[:2 * n_pares]])
+        filhos, fitness = recombinador.recombinar_lote(cromossomos[0::2], cromossomos[1::2])
+
+        novos_individuos = []
+        for cromossomo, valor in zip(filhos, fitness):
+            filho = Individuo(data=self.dados, individuo=cromossomo)
+            filho.fitness = valor
+            novos_individuos.append(filho)
     
-        for i in range(0, len(pais) - 1, 2):
-            filhos = recombinador.recombinar(pais[i], pais[i+1])
-            
-            # Se o recombinação retornar apenas um filho, converte para lista
-            if not isinstance(filhos, (list)):
-                filhos = [filhos]
-            
-            novos_individuos.extend(filhos)
-    
-        self.individuos.extend(novos_individuos)
-        self._set_melhor_individuo_global()
+        if novos_individuos:
+            self.individuos.extend(novos_individuos)
+            self._ordenada = False
+            self._set_melhor_individuo_global(novos_individuos)
         return self.individuos
 
     def mutar_populacao(self,*,dmax: float=1, prob_mutacao: float = 0.03) -> None:
@@ -171,10 +199,11 @@ class Populacao:
             dmax: Valor máximo de alteração para cada coordenada durante a mutação.
             prob_mutacao: Probabilidade de mutação para cada coordenada (default: 0.03).
         """
-        for individuo in self.individuos:
-            individuo.mutate(dmax, prob_mutacao)
+        mutados = [individuo for individuo in self.individuos if individuo.mutate(dmax, prob_mutacao)]
 
-        self._set_melhor_individuo_global()
+        if mutados:
+            self._ordenada = False
+            self._set_melhor_individuo_global(mutados)
        
 
     def substituir_populacao(self, porcentagem_elite: float = 0.2) -> None:
@@ -182,37 +211,118 @@ class Populacao:
         Substitui a população atual por uma nova geração de indivíduos.
         
         Preserva a elite e realiza seleção proporcional ao fitness para os demais.
+        A elite é obtida com `np.argpartition` (sem ordenar toda a população) e o
+        sorteio com reposição é feito pelo NumPy sobre o vetor de pesos.
         
         Args:
             porcentagem_elite: Proporção dos melhores indivíduos a serem preservados.
         """
-        
-        
-        self.individuos.sort(key=lambda ind: ind.fitness)
+        fitness = self._fitness_individuos()
+        qtd_elite = min(int(self.tamanho * porcentagem_elite), len(fitness))
 
-        qtd_elite = int(self.tamanho * porcentagem_elite)
-        elite = self.individuos[:qtd_elite]
+        if self._ordenada:
+            indices_elite = np.arange(qtd_elite)
+        elif qtd_elite:
+            indices_elite = np.argpartition(fitness, qtd_elite - 1)[:qtd_elite]
+            indices_elite = indices_elite[np.argsort(fitness[indices_elite], kind="stable")]
+        else:
+            indices_elite = np.arange(0)
+        elite = [self.individuos[i] for i in indices_elite]
 
         # Verificar se há alguém na elite com fitness igual ou melhor que o melhor global
-        melhor_global_representado = any(ind.fitness <= self.melhor_global.fitness for ind in elite)
+        melhor_global_representado = bool(np.any(fitness[indices_elite] <= self.melhor_global.fitness))
 
-        if not melhor_global_representado:
-            # print("Melhor global não está representado na elite")
+        if elite and not melhor_global_representado:
             # Substituir o pior membro da elite (considerando que elite já está ordenada)
-            elite[-1] = self.melhor_global
+            # Insere uma cópia, para que mutações na população não alterem o melhor global
+            elite[-1] = self.melhor_global.copiar()
 
-        restantes = self.individuos[qtd_elite:]
+        restantes = np.ones(len(fitness), dtype=bool)
+        restantes[indices_elite] = False
+        indices_restantes = np.flatnonzero(restantes)
 
-       
         """
             indivíduos com fitness menor terão um peso maior (pois 1.0 f/ fitness aumenta quando fitness diminui).
             Isso garante que indivíduos com fitness menor tenham uma chance maior de serem selecionados.
         """
-        pesos = [(1.0 / ind.fitness if ind.fitness > 0 else 1.0) for ind in restantes]
+        fitness_restantes = fitness[indices_restantes]
+        pesos = np.ones_like(fitness_restantes)
+        np.divide(1.0, fitness_restantes, out=pesos, where=fitness_restantes > 0)
 
         qtd_restante = self.tamanho - len(elite)
-        selecionados = random.choices(restantes, weights=pesos, k=qtd_restante)
+        sorteados = np.random.choice(indices_restantes, size=qtd_restante, p=pesos / pesos.sum())
+
+        # Um indivíduo sorteado mais de uma vez é copiado, para que as cópias sofram mutações independentes
+        selecionados = []
+        vistos = set()
+        for i in sorteados:
+            selecionados.append(self.individuos[i].copiar() if i in vistos else self.individuos[i])
+            vistos.add(i)
 
-        
         self.individuos = elite + selecionados
-        self._set_melhor_individuo_global()
+        self._ordenada = False
+
+    def aplicar_busca_local(self, busca: BuscaLocalMemetica) -> int:
+        """
+        Refina os melhores indivíduos com a busca local memética, no próprio lugar.
+
+        Args:
+            busca: Busca local aplicada aos `busca.n_elite` melhores indivíduos.
+
+        Returns:
+            Quantidade de avaliações de fitness consumidas.
+        """
+        self._ordenar()
+        elite = self.individuos[:busca.n_elite]
+        if not elite:
+            return 0
+        cromossomos, fitness, avaliacoes = busca.refinar(np.array([ind.individuo for ind in elite]),
+                                                         np.array([ind.fitness for ind in elite]))
+
+        alterados = []
+        for individuo, cromossomo, valor in zip(elite, cromossomos, fitness):
+            if valor < individuo.fitness:
+                individuo.individuo = cromossomo
+                individuo.fitness = valor
+                alterados.append(individuo)
+
+        if alterados:
+            self._ordenada = False
+            self._set_melhor_individuo_global(alterados)
+        return avaliacoes
+
+    def emigrantes(self, quantidade: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Seleciona os melhores indivíduos para migrar para outra população.
+
+        Args:
+            quantidade: Número de indivíduos a serem exportados.
+
+        Returns:
+            Tupla (cromossomos, fitness), com formatos (quantidade, k, d) e (quantidade,).
+        """
+        self._ordenar()
+        melhores = self.individuos[:quantidade]
+        return np.array([ind.individuo for ind in melhores]), np.array([ind.fitness for ind in melhores])
+
+    def receber_imigrantes(self, cromossomos: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Substitui os piores indivíduos da população pelos imigrantes recebidos.
+
+        Args:
+            cromossomos: Centróides dos imigrantes, formato (n, k, d).
+            fitness: Fitness já calculado de cada imigrante, formato (n,).
+        """
+        self._ordenar()
+        # No máximo um imigrante por indivíduo da população, como em PopulacaoVetorizada
+        quantidade = min(len(fitness), len(self.individuos))
+        imigrantes = []
+        for posicao, (cromossomo, valor) in enumerate(zip(cromossomos[:quantidade], fitness[:quantidade]), start=1):
+            imigrante = Individuo(data=self.dados, individuo=cromossomo.copy())
+            imigrante.fitness = valor
+            self.individuos[-posicao] = imigrante
+            imigrantes.append(imigrante)
+
+        if imigrantes:
+            self._ordenada = False
+            self._set_melhor_individuo_global(imigrantes)
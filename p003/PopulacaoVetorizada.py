@@ -0,0 +1,264 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from Individuo import Individuo
+from RecombinadorStrategy import RecombinadorStrategy
+from memetico import BuscaLocalMemetica
+from avaliacao import calcular_fitness_lote
+
+
+class PopulacaoVetorizada:
+    """
+    População do algoritmo genético armazenada em arrays contíguos.
+
+    Oferece a mesma interface de `Populacao`, mas, em vez de uma lista de objetos
+    `Individuo`, guarda todos os cromossomos em um único array
+    (tamanho, n_centroides, n_features) e o fitness em um vetor. O fitness de
+    toda a população é calculado em uma única passagem vetorizada, e a mutação,
+    a seleção e a substituição são operações sobre esses arrays.
+
+    Attributes:
+        tamanho (int): Número de indivíduos na população.
+        dados (np.ndarray): Base de dados utilizada para o cálculo do fitness.
+        cromossomos (np.ndarray): Centróides de cada indivíduo, formato (n, n_centroides, n_features).
+        fitness (np.ndarray): Fitness de cada indivíduo, formato (n,).
+        melhor_cromossomo (np.ndarray): Centróides do melhor indivíduo encontrado até o momento.
+        melhor_fitness (float): Fitness do melhor indivíduo encontrado até o momento.
+    """
+
+    def __init__(self, tamanho: int, dados: np.ndarray, semente: Optional[int] = None) -> None:
+        """
+        Inicializa a população com o número especificado de indivíduos.
+
+        Args:
+            tamanho: Número de indivíduos na população.
+            dados: Base de dados a ser utilizada para o cálculo do fitness.
+            semente: Semente do gerador de números aleatórios (opcional).
+        """
+        self.tamanho = tamanho
+        self.dados = dados
+        self.rng = np.random.default_rng(semente)
+
+        self.cromossomos = self._inicializar_populacao()
+        self.fitness = calcular_fitness_lote(self.dados, self.cromossomos)
+        # Indica se os arrays estão ordenados por fitness desde a última alteração
+        self._ordenada = False
+        self._ordenar()
+
+        self.melhor_cromossomo = self.cromossomos[0].copy()
+        self.melhor_fitness = self.fitness[0]
+
+    def _inicializar_populacao(self) -> np.ndarray:
+        """
+        Cria os cromossomos iniciais: a solução anterior seguida de centróides
+        aleatórios uniformes em [0, 2) até completar o tamanho da população.
+
+        Returns:
+            Array de cromossomos com formato (tamanho, 3, 2).
+        """
+        solucao_anterior = np.array([
+            [0.23242425, 0.16964401],
+            [-1.00234577, -0.99855091],
+            [1.11694924, 1.17118187]
+        ])
+        aleatorios = self.rng.uniform(0, 2, size=(self.tamanho - 1,) + solucao_anterior.shape)
+        return np.concatenate([solucao_anterior[np.newaxis], aleatorios])
+
+    @property
+    def melhor_global(self) -> Individuo:
+        """
+        Melhor indivíduo encontrado até o momento, como `Individuo`.
+        """
+        melhor = Individuo(data=self.dados, individuo=self.melhor_cromossomo.copy())
+        melhor.fitness = self.melhor_fitness
+        return melhor
+
+    @property
+    def individuos(self) -> List[Individuo]:
+        """
+        Indivíduos da população atual, como objetos `Individuo` (apenas para inspeção).
+        """
+        return [self._como_individuo(i) for i in range(len(self.fitness))]
+
+    def _como_individuo(self, i: int) -> Individuo:
+        individuo = Individuo(data=self.dados, individuo=self.cromossomos[i].copy())
+        individuo.fitness = self.fitness[i]
+        return individuo
+
+    def _ordenar(self) -> None:
+        """
+        Ordena cromossomos e fitness do melhor (menor fitness) para o pior, apenas
+        se a ordem atual não for mais válida.
+        """
+        if not self._ordenada:
+            ordem = np.argsort(self.fitness, kind="stable")
+            self.cromossomos = self.cromossomos[ordem]
+            self.fitness = self.fitness[ordem]
+            self._ordenada = True
+
+    def _set_melhor_individuo_global(self, linhas: Optional[np.ndarray] = None) -> None:
+        """
+        Atualiza o melhor indivíduo global comparando-o apenas com as linhas informadas
+        (indivíduos novos ou alterados).
+
+        Args:
+            linhas: Índices dos candidatos (default: toda a população).
+        """
+        linhas = np.arange(len(self.fitness)) if linhas is None else linhas
+        if linhas.size == 0:
+            return
+        i = linhas[int(np.argmin(self.fitness[linhas]))]
+        if self.fitness[i] < self.melhor_fitness:
+            self.melhor_cromossomo = self.cromossomos[i].copy()
+            self.melhor_fitness = self.fitness[i]
+
+    def selecionar_individuos(self) -> np.ndarray:
+        """
+        Ordena a população pelo fitness, priorizando os melhores para a recombinação.
+
+        Returns:
+            Array de cromossomos ordenados por fitness.
+        """
+        self._ordenar()
+        return self.cromossomos
+
+    def recombinar(self, recombinador: RecombinadorStrategy) -> np.ndarray:
+        """
+        Recombina pares consecutivos de indivíduos selecionados e acrescenta os
+        filhos à população.
+
+        Args:
+            recombinador: Estratégia de recombinação a ser utilizada.
+
+        Returns:
+            Array de cromossomos da população, incluindo os filhos.
+        """
+        self.selecionar_individuos()
+
+        # Pares consecutivos (0, 1), (2, 3), ... recombinados em uma única chamada
+        n_pares = len(self.fitness) // 2
+        filhos, fitness = recombinador.recombinar_lote(self.cromossomos[0:2 * n_pares:2],
+                                                       self.cromossomos[1:2 * n_pares:2])
+        inicio = len(self.fitness)
+        self.cromossomos = np.concatenate([self.cromossomos, filhos])
+        self.fitness = np.concatenate([self.fitness, fitness])
+
+        if len(fitness):
+            self._ordenada = False
+            self._set_melhor_individuo_global(np.arange(inicio, len(self.fitness)))
+        return self.cromossomos
+
+    def mutar_populacao(self, *, dmax: float = 1, prob_mutacao: float = 0.03) -> None:
+        """
+        Aplica o operador de mutação a toda a população de uma só vez.
+
+        Cada centróide de cada indivíduo sofre mutação com probabilidade
+        `prob_mutacao`, somando a cada coordenada um valor uniforme em [-dmax, dmax].
+        Apenas os indivíduos efetivamente alterados têm o fitness recalculado.
+
+        Args:
+            dmax: Valor máximo de alteração para cada coordenada durante a mutação.
+            prob_mutacao: Probabilidade de mutação para cada centróide (default: 0.03).
+        """
+        n, k, d = self.cromossomos.shape
+        mutados = self.rng.random((n, k)) < prob_mutacao
+        linhas = np.flatnonzero(np.any(mutados, axis=1))
+
+        if linhas.size:
+            deslocamentos = self.rng.uniform(-dmax, dmax, size=(linhas.size, k, d))
+            self.cromossomos[linhas] += deslocamentos * mutados[linhas, :, np.newaxis]
+            self.fitness[linhas] = calcular_fitness_lote(self.dados, self.cromossomos[linhas])
+            self._ordenada = False
+            self._set_melhor_individuo_global(linhas)
+
+    def substituir_populacao(self, porcentagem_elite: float = 0.2) -> None:
+        """
+        Substitui a população atual por uma nova geração de indivíduos.
+
+        Preserva a elite e realiza seleção proporcional a 1 / fitness (com reposição)
+        para os demais, garantindo que o melhor global esteja representado na elite.
+        A elite é obtida com `np.argpartition`, sem ordenar toda a população.
+
+        Args:
+            porcentagem_elite: Proporção dos melhores indivíduos a serem preservados.
+        """
+        qtd_elite = min(int(self.tamanho * porcentagem_elite), len(self.fitness))
+
+        if self._ordenada:
+            indices_elite = np.arange(qtd_elite)
+        elif qtd_elite:
+            indices_elite = np.argpartition(self.fitness, qtd_elite - 1)[:qtd_elite]
+            indices_elite = indices_elite[np.argsort(self.fitness[indices_elite], kind="stable")]
+        else:
+            indices_elite = np.arange(0)
+        elite_cromossomos = self.cromossomos[indices_elite]
+        elite_fitness = self.fitness[indices_elite]
+
+        # Substitui o pior membro da elite pelo melhor global, se ele não estiver representado
+        if qtd_elite and not np.any(elite_fitness <= self.melhor_fitness):
+            elite_cromossomos[-1] = self.melhor_cromossomo
+            elite_fitness[-1] = self.melhor_fitness
+
+        restantes = np.ones(len(self.fitness), dtype=bool)
+        restantes[indices_elite] = False
+        indices_restantes = np.flatnonzero(restantes)
+
+        restantes_fitness = self.fitness[indices_restantes]
+        pesos = np.ones_like(restantes_fitness)
+        np.divide(1.0, restantes_fitness, out=pesos, where=restantes_fitness > 0)
+        qtd_restante = self.tamanho - qtd_elite
+        escolhidos = self.rng.choice(indices_restantes, size=qtd_restante, p=pesos / pesos.sum())
+
+        self.cromossomos = np.concatenate([elite_cromossomos, self.cromossomos[escolhidos]])
+        self.fitness = np.concatenate([elite_fitness, self.fitness[escolhidos]])
+        self._ordenada = False
+
+    def aplicar_busca_local(self, busca: BuscaLocalMemetica) -> int:
+        """
+        Refina os melhores indivíduos com a busca local memética, no próprio lugar.
+
+        Args:
+            busca: Busca local aplicada aos `busca.n_elite` melhores indivíduos.
+
+        Returns:
+            Quantidade de avaliações de fitness consumidas.
+        """
+        self._ordenar()
+        n = min(busca.n_elite, len(self.fitness))
+        cromossomos, fitness, avaliacoes = busca.refinar(self.cromossomos[:n], self.fitness[:n])
+
+        alterados = np.flatnonzero(fitness < self.fitness[:n])
+        if alterados.size:
+            self.cromossomos[alterados] = cromossomos[alterados]
+            self.fitness[alterados] = fitness[alterados]
+            self._ordenada = False
+            self._set_melhor_individuo_global(alterados)
+        return avaliacoes
+
+    def emigrantes(self, quantidade: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Seleciona os melhores indivíduos para migrar para outra população.
+
+        Args:
+            quantidade: Número de indivíduos a serem exportados.
+
+        Returns:
+            Tupla (cromossomos, fitness), com formatos (quantidade, k, d) e (quantidade,).
+        """
+        self._ordenar()
+        return self.cromossomos[:quantidade].copy(), self.fitness[:quantidade].copy()
+
+    def receber_imigrantes(self, cromossomos: np.ndarray, fitness: np.ndarray) -> None:
+        """
+        Substitui os piores indivíduos da população pelos imigrantes recebidos.
+
+        Args:
+            cromossomos: Centróides dos imigrantes, formato (n, k, d).
+            fitness: Fitness já calculado de cada imigrante, formato (n,).
+        """
+        self._ordenar()
+        quantidade = min(len(fitness), len(self.fitness))
+        if quantidade:
+            self.cromossomos[-quantidade:] = cromossomos[:quantidade]
+            self.fitness[-quantidade:] = fitness[:quantidade]
+            self._ordenada = False
+            self._set_melhor_individuo_global(np.arange(len(self.fitness) - quantidade, len(self.fitness)))
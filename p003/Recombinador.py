@@ -78,8 +78,8 @@ class Recombinador:
         centroide_direita_i2 = ind2.individuo[2].copy()
 
         # Cria os filhos
-        filho1 = Individuo(data=cls.dados)
-        filho2 = Individuo(data=cls.dados)
+        filho1 = Individuo.vazio(data=cls.dados)
+        filho2 = Individuo.vazio(data=cls.dados)
 
         # Filho 1: usa a extremidade esquerda de ind2, centróide central de ind1 e extremidade direita de ind2
         
@@ -93,9 +93,6 @@ class Recombinador:
         filho2.individuo[1] = centroide_central_i2
         filho2.individuo[2] = centroide_direita_i1
 
-        filho1.calculate_fitness(cls.dados)
-        filho2.calculate_fitness(cls.dados)
-
         return filho1, filho2
 
     @classmethod
@@ -129,7 +126,7 @@ class Recombinador:
         media_centroide_meio = (ind1.individuo[1] + ind2.individuo[1]) / 2
         media_centroide_direita = (ind1.individuo[2] + ind2.individuo[2]) / 2
 
-        filho = Individuo(data=cls.dados)
+        filho = Individuo.vazio(data=cls.dados)
         filho.individuo[0] = media_centroide_esquerda
         filho.individuo[1] = media_centroide_meio
         filho.individuo[2] = media_centroide_direita
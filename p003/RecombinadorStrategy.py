@@ -3,6 +3,7 @@ from typing import Tuple, Union
 import numpy as np
 from Individuo import Individuo
 from typing import ClassVar
+from avaliacao import calcular_fitness_lote
 
 class RecombinadorStrategy(ABC):
     """
@@ -26,3 +27,33 @@ class RecombinadorStrategy(ABC):
         Realiza a recombinação entre dois indivíduos, gerando um ou dois novos indivíduos.
         """
         pass
+
+    def recombinar_lote(self, pais1: np.ndarray, pais2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recombina vários pares de pais de uma só vez.
+
+        O par i é formado por `pais1[i]` e `pais2[i]`. A implementação padrão chama
+        `recombinar` para cada par e calcula o fitness de todos os filhos em uma
+        única passagem vetorizada; as estratégias concretas podem sobrescrevê-la
+        com uma versão totalmente vetorizada.
+
+        Args:
+            pais1: Cromossomos do primeiro pai de cada par, formato (n_pares, k, d).
+            pais2: Cromossomos do segundo pai de cada par, formato (n_pares, k, d).
+
+        Returns:
+            Tupla (filhos, fitness), com formatos (n_filhos, k, d) e (n_filhos,),
+            com os filhos na mesma ordem produzida por `recombinar` par a par.
+        """
+        filhos = []
+        for cromossomo1, cromossomo2 in zip(pais1, pais2):
+            gerados = self.recombinar(Individuo(data=self.dados, individuo=cromossomo1),
+                                      Individuo(data=self.dados, individuo=cromossomo2))
+            if not isinstance(gerados, list):
+                gerados = [gerados]
+            filhos.extend(filho.individuo for filho in gerados)
+
+        if not filhos:
+            return np.empty((0,) + pais1.shape[1:]), np.empty(0)
+        filhos = np.array(filhos)
+        return filhos, calcular_fitness_lote(self.dados, filhos)
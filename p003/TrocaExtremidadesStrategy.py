@@ -3,6 +3,7 @@ from typing import Tuple, Union
 import numpy as np
 from Individuo import Individuo
 from typing import Tuple, ClassVar
+from avaliacao import calcular_fitness_lote
 from RecombinadorStrategy import RecombinadorStrategy
 
 class TrocaExtremidadesStrategy(RecombinadorStrategy):
@@ -35,8 +36,8 @@ class TrocaExtremidadesStrategy(RecombinadorStrategy):
         cada solução parental.
         
         Esquema de recombinação:
-            - Filho 1: [centróide esquerdo do ind2, centróide central do ind1, centróide direito do ind2]
-            - Filho 2: [centróide esquerdo do ind1, centróide central do ind2, centróide direito do ind1]
+            - Filho 1: [centróide esquerdo do ind2, centróides centrais do ind1, centróide direito do ind2]
+            - Filho 2: [centróide esquerdo do ind1, centróides centrais do ind2, centróide direito do ind1]
         
         Args:
             ind1: Primeiro indivíduo pai.
@@ -52,25 +53,35 @@ class TrocaExtremidadesStrategy(RecombinadorStrategy):
         if self.dados is None:
             raise ValueError("É necessário definir os dados com set_dados() antes de recombinar indivíduos")
            
-        # Cópia dos centróides
-        centroide_esquerda_i1 = ind1.individuo[0].copy()
-        centroide_central_i1  = ind1.individuo[1].copy()
-        centroide_direita_i1  = ind1.individuo[2].copy()
-        centroide_esquerda_i2 = ind2.individuo[0].copy()
-        centroide_central_i2  = ind2.individuo[1].copy()
-        centroide_direita_i2  = ind2.individuo[2].copy()
+        # Índices do primeiro e do último centróide (as extremidades); os demais são centrais
+        extremidades = [0, len(ind1.individuo) - 1]
 
-        filho1 = Individuo(data=self.dados)
-        filho2 = Individuo(data=self.dados)
-        
-        filho1.individuo[0] = centroide_esquerda_i2
-        filho1.individuo[1] = centroide_central_i1
-        filho1.individuo[2] = centroide_direita_i2
-
-        filho2.individuo[0] = centroide_esquerda_i1
-        filho2.individuo[1] = centroide_central_i2
-        filho2.individuo[2] = centroide_direita_i1
+        genoma1 = ind1.individuo.copy()
+        genoma1[extremidades] = ind2.individuo[extremidades]
+        genoma2 = ind2.individuo.copy()
+        genoma2[extremidades] = ind1.individuo[extremidades]
 
-        filho1.calculate_fitness(self.dados)
-        filho2.calculate_fitness(self.dados)
+        filho1 = Individuo(data=self.dados, individuo=genoma1)
+        filho2 = Individuo(data=self.dados, individuo=genoma2)
         return [filho1, filho2]
+
+    def recombinar_lote(self, pais1: np.ndarray, pais2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recombina todos os pares de uma só vez: dois filhos por par, trocando as
+        extremidades (primeiro e último centróides) entre os pais.
+
+        Args:
+            pais1: Cromossomos do primeiro pai de cada par, formato (n_pares, k, d).
+            pais2: Cromossomos do segundo pai de cada par, formato (n_pares, k, d).
+
+        Returns:
+            Tupla (filhos, fitness), com formatos (2 * n_pares, k, d) e (2 * n_pares,),
+            intercalando filho 1 e filho 2 de cada par.
+        """
+        extremidades = [0, pais1.shape[1] - 1]
+
+        filhos = np.stack([pais1, pais2], axis=1)
+        filhos[:, 0, extremidades] = pais2[:, extremidades]
+        filhos[:, 1, extremidades] = pais1[:, extremidades]
+        filhos = filhos.reshape((-1,) + pais1.shape[1:])
+        return filhos, calcular_fitness_lote(self.dados, filhos)
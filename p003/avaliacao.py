@@ -0,0 +1,238 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Cache de fitness ativo (ver `ativar_cache`); None desativa a memoização
+_cache: Optional["CacheFitness"] = None
+
+# Cromossomos avaliados sobre a base de dados desde o início do processo (ver `total_avaliacoes`)
+_avaliacoes: int = 0
+
+
+class CacheFitness:
+    """
+    Cache LRU limitado de fitness, indexado pelo cromossomo.
+
+    A chave é canônica: as coordenadas são quantizadas em uma grade de passo
+    `resolucao` e os centróides são ordenados lexicograficamente, de modo que
+    cópias de um mesmo cromossomo, ou o mesmo conjunto de centróides em outra
+    ordem, compartilham a mesma entrada. Cada acerto evita uma passagem
+    completa sobre a base de dados.
+
+    Attributes:
+        dados (np.ndarray): Base de dados à qual os valores em cache se referem.
+        capacidade (int): Quantidade máxima de entradas mantidas.
+        resolucao (float): Passo da grade de quantização das coordenadas.
+        acertos (int): Avaliações atendidas por entradas já presentes no cache.
+        repetidos (int): Cromossomos repetidos dentro de um mesmo lote, avaliados
+                         uma única vez junto com a primeira ocorrência.
+        falhas (int): Avaliações que precisaram percorrer a base de dados.
+    """
+
+    def __init__(self, dados: np.ndarray, capacidade: int = 4096, resolucao: float = 1e-12) -> None:
+        """
+        Inicializa o cache vazio.
+
+        Args:
+            dados: Base de dados à qual os valores em cache se referem.
+            capacidade: Quantidade máxima de entradas mantidas (default: 4096).
+            resolucao: Passo da grade de quantização das coordenadas (default: 1e-12).
+        """
+        self.dados = dados
+        self.capacidade = capacidade
+        self.resolucao = resolucao
+        self.acertos = 0
+        self.repetidos = 0
+        self.falhas = 0
+        self._valores: "OrderedDict[bytes, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._valores)
+
+    def chave(self, cromossomo: np.ndarray) -> bytes:
+        """
+        Calcula a chave canônica de um cromossomo.
+
+        Args:
+            cromossomo: Centróides no formato (k, d).
+
+        Returns:
+            Chave (bytes) independente da ordem dos centróides.
+        """
+        return self._chaves(np.asarray(cromossomo, dtype=float)[np.newaxis])[0]
+
+    def _chaves(self, cromossomos: np.ndarray) -> list:
+        """
+        Calcula as chaves canônicas de vários cromossomos de uma só vez.
+
+        Args:
+            cromossomos: Centróides de cada cromossomo, formato (n, k, d).
+
+        Returns:
+            Lista com a chave (bytes) de cada cromossomo.
+        """
+        n, k, d = cromossomos.shape
+        grade = np.round(cromossomos / self.resolucao).astype(np.int64).reshape(n * k, d)
+
+        # Ordena os centróides de cada cromossomo (chave primária: o cromossomo; depois, as coordenadas)
+        ordem = np.lexsort(tuple(grade.T[::-1]) + (np.repeat(np.arange(n), k),))
+        canonicos = grade[ordem].reshape(n, k * d)
+        return [linha.tobytes() for linha in canonicos]
+
+    def avaliar_lote(self, cromossomos: np.ndarray) -> np.ndarray:
+        """
+        Calcula o fitness de vários cromossomos, avaliando apenas os ausentes do
+        cache (sem repetições) em uma única passagem vetorizada.
+
+        Args:
+            cromossomos: Centróides de cada cromossomo, formato (n, k, d).
+
+        Returns:
+            Vetor (n,) com o fitness de cada cromossomo.
+        """
+        cromossomos = np.asarray(cromossomos, dtype=float)
+        fitness = np.empty(len(cromossomos))
+        pendentes: Dict[bytes, list] = {}
+
+        for i, chave in enumerate(self._chaves(cromossomos)):
+            valor = self._valores.get(chave)
+            if valor is not None:
+                self._valores.move_to_end(chave)
+                fitness[i] = valor
+                self.acertos += 1
+            elif chave in pendentes:
+                pendentes[chave].append(i)
+                self.repetidos += 1
+            else:
+                pendentes[chave] = [i]
+                self.falhas += 1
+
+        if pendentes:
+            primeiros = [indices[0] for indices in pendentes.values()]
+            valores = _fitness_lote(self.dados, cromossomos[primeiros])
+            for (chave, indices), valor in zip(pendentes.items(), valores):
+                fitness[indices] = valor
+                self._valores[chave] = valor
+            while len(self._valores) > self.capacidade:
+                self._valores.popitem(last=False)
+
+        return fitness
+
+    def estatisticas(self) -> Dict[str, float]:
+        """
+        Resume o uso do cache.
+
+        Returns:
+            Dicionário com acertos, repetidos, falhas, taxa de acerto e entradas em
+            uso. Cada acerto ou repetido corresponde a uma passagem sobre a base de
+            dados evitada; a taxa de acerto considera apenas os acertos do cache.
+        """
+        total = self.acertos + self.repetidos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "repetidos": self.repetidos,
+            "falhas": self.falhas,
+            "taxa_acerto": self.acertos / total if total else 0.0,
+            "entradas": len(self._valores),
+        }
+
+
+def ativar_cache(cache: Optional[CacheFitness]) -> None:
+    """
+    Define o cache usado por `calcular_fitness_lote` e `calcular_fitness`.
+
+    O cache só é consultado quando a base de dados avaliada é a mesma (o mesmo
+    objeto) para a qual ele foi criado. None desativa a memoização.
+
+    Args:
+        cache: Cache a ser utilizado, ou None.
+    """
+    global _cache
+    _cache = cache
+
+
+def calcular_fitness_lote(data: np.ndarray, cromossomos: np.ndarray) -> np.ndarray:
+    """
+    Calcula o fitness de vários cromossomos, consultando o cache ativo (se houver)
+    antes de percorrer a base de dados.
+
+    Args:
+        data: Conjunto de dados no formato (n_samples, n_features).
+        cromossomos: Centróides de cada cromossomo, no formato
+                     (n_cromossomos, n_centroides, n_features).
+
+    Returns:
+        Vetor (n_cromossomos,) com o fitness de cada cromossomo.
+    """
+    if _cache is not None and _cache.dados is data:
+        return _cache.avaliar_lote(cromossomos)
+    return _fitness_lote(data, cromossomos)
+
+
+def total_avaliacoes() -> int:
+    """
+    Quantidade de cromossomos avaliados sobre a base de dados no processo atual.
+
+    Conta apenas as passagens efetivas pela base: avaliações atendidas pelo
+    cache não entram na contagem. É a medida usada pelos orçamentos de
+    avaliações dos critérios de parada.
+
+    Returns:
+        Total de avaliações realizadas.
+    """
+    return _avaliacoes
+
+
+def _fitness_lote(data: np.ndarray, cromossomos: np.ndarray) -> np.ndarray:
+    """
+    Calcula o fitness de vários cromossomos em uma única passagem vetorizada.
+
+    Para cada cromossomo, o fitness é a soma das distâncias euclidianas de cada
+    ponto ao centróide mais próximo. As diferenças quadráticas são acumuladas
+    feature a feature em matrizes (n_cromossomos, n_samples), mantendo apenas o
+    mínimo por centróide; a raiz é aplicada somente ao mínimo final.
+
+    Args:
+        data: Conjunto de dados no formato (n_samples, n_features).
+        cromossomos: Centróides de cada cromossomo, no formato
+                     (n_cromossomos, n_centroides, n_features).
+
+    Returns:
+        Vetor (n_cromossomos,) com o fitness de cada cromossomo.
+    """
+    global _avaliacoes
+    cromossomos = np.asarray(cromossomos, dtype=float)
+    _avaliacoes += len(cromossomos)
+    menor_quadrado = None
+
+    for j in range(cromossomos.shape[1]):
+        quadrado = None
+        for feature in range(data.shape[1]):
+            diff = data[np.newaxis, :, feature] - cromossomos[:, j, feature, np.newaxis]
+            diff *= diff
+            if quadrado is None:
+                quadrado = diff
+            else:
+                quadrado += diff
+        if menor_quadrado is None:
+            menor_quadrado = quadrado
+        else:
+            np.minimum(menor_quadrado, quadrado, out=menor_quadrado)
+
+    return np.sum(np.sqrt(menor_quadrado, out=menor_quadrado), axis=1)
+
+
+def calcular_fitness(data: np.ndarray, centroides: np.ndarray) -> float:
+    """
+    Calcula o fitness de um único conjunto de centróides.
+
+    Args:
+        data: Conjunto de dados no formato (n_samples, n_features).
+        centroides: Centróides em qualquer formato com n_features na última
+                    dimensão, por exemplo (3, 1, 2) ou (3, 2).
+
+    Returns:
+        Soma das distâncias mínimas dos pontos aos centróides.
+    """
+    centroides = np.asarray(centroides, dtype=float).reshape(1, -1, data.shape[1])
+    return calcular_fitness_lote(data, centroides)[0]
@@ -5,6 +5,9 @@ del *.out /Q
 echo Limpando arquivos .log...
 del *.log /Q
 
+echo Limpando o registro da execucao anterior...
+del saida.csv saida*.npz /Q
+
 echo Executando main.py...
 python3 .\main.py
 
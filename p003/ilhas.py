@@ -0,0 +1,263 @@
+import numpy as np
+import random
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from typing import List, Optional, Sequence, Tuple, Type
+from avaliacao import CacheFitness, ativar_cache, total_avaliacoes
+from Individuo import Individuo
+from memetico import BuscaLocalMemetica
+from parada import StoppingCriteria
+from Populacao import Populacao
+from PopulacaoVetorizada import PopulacaoVetorizada
+from RecombinadorStrategy import RecombinadorStrategy
+
+# Topologias de migração suportadas
+TOPOLOGIAS = ("anel", "completa")
+
+
+def _executar_ilha(conexao: Connection, dados: np.ndarray, tamanho: int, semente: int,
+                   estrategia: Type[RecombinadorStrategy], vetorizada: bool,
+                   parametros: dict) -> None:
+    """
+    Laço de um processo trabalhador: mantém uma população (ilha) e atende aos
+    comandos do coordenador até receber "fim".
+
+    Comandos recebidos pela conexão:
+        ("evoluir", geracoes, n_migrantes): evolui a ilha e responde com o
+            histórico do melhor fitness por geração, o melhor cromossomo de cada
+            geração, os emigrantes e as avaliações de fitness realizadas desde a
+            resposta anterior.
+        ("imigrar", cromossomos, fitness): substitui os piores indivíduos.
+        ("fim",): responde com o melhor cromossomo e fitness e encerra.
+    """
+    # Cada ilha tem seu próprio cache de fitness, sobre a sua cópia dos dados
+    if parametros["capacidade_cache"] > 0:
+        ativar_cache(CacheFitness(dados, capacidade=parametros["capacidade_cache"]))
+
+    # Busca local memética da ilha, sobre a sua cópia dos dados (None desativa)
+    busca_local = None
+    if parametros["busca_local"] is not None:
+        busca_local = BuscaLocalMemetica(dados, semente=semente, **parametros["busca_local"])
+
+    # Avaliações contadas a partir daqui (incluem as da população inicial)
+    avaliacoes = total_avaliacoes()
+
+    # Cada ilha tem sua própria semente; a Populacao usa os geradores globais
+    np.random.seed(semente)
+    random.seed(semente)
+    if vetorizada:
+        populacao = PopulacaoVetorizada(tamanho=tamanho, dados=dados, semente=semente)
+    else:
+        populacao = Populacao(tamanho=tamanho, dados=dados)
+    recombinador = estrategia(data=dados)
+    geracao = 0
+
+    while True:
+        comando, *argumentos = conexao.recv()
+
+        if comando == "evoluir":
+            geracoes, n_migrantes = argumentos
+            historico, cromossomos = [], []
+            for _ in range(geracoes):
+                populacao.selecionar_individuos()
+                populacao.recombinar(recombinador=recombinador)
+                populacao.mutar_populacao(dmax=parametros["dmax"], prob_mutacao=parametros["prob_mutacao"])
+                populacao.substituir_populacao(porcentagem_elite=parametros["porcentagem_elite"])
+                if busca_local is not None and busca_local.deve_aplicar(geracao):
+                    populacao.aplicar_busca_local(busca_local)
+                melhor = populacao.melhor_global
+                historico.append(melhor.fitness)
+                cromossomos.append(melhor.individuo.copy())
+                geracao += 1
+            realizadas, avaliacoes = total_avaliacoes() - avaliacoes, total_avaliacoes()
+            conexao.send((historico, np.array(cromossomos), populacao.emigrantes(n_migrantes), realizadas))
+
+        elif comando == "imigrar":
+            populacao.receber_imigrantes(*argumentos)
+
+        else:
+            melhor = populacao.melhor_global
+            conexao.send((melhor.individuo, melhor.fitness))
+            conexao.close()
+            return
+
+
+class ModeloIlhas:
+    """
+    Algoritmo genético paralelo no modelo de ilhas.
+
+    Cada ilha é uma população independente, evoluída em um processo próprio, com
+    sua semente e sua estratégia de recombinação. A cada `intervalo_migracao`
+    gerações, os melhores indivíduos de cada ilha migram para as ilhas vizinhas
+    segundo a topologia escolhida, substituindo os piores indivíduos do destino:
+
+        - "anel": a ilha i envia seus migrantes para a ilha (i + 1) mod n.
+        - "completa": cada ilha recebe os melhores migrantes entre todas as demais.
+
+    Attributes:
+        dados (np.ndarray): Base de dados utilizada para o cálculo do fitness.
+        n_ilhas (int): Quantidade de ilhas (processos).
+        tamanho (int): Número de indivíduos de cada ilha.
+        estrategias (List[Type[RecombinadorStrategy]]): Estratégia de cada ilha
+            (distribuídas de forma circular se houver menos estratégias que ilhas).
+        intervalo_migracao (int): Gerações entre duas migrações.
+        n_migrantes (int): Indivíduos enviados por ilha a cada migração.
+        topologia (str): Topologia de migração ("anel" ou "completa").
+        vetorizada (bool): Se True, as ilhas usam `PopulacaoVetorizada`.
+        semente (Optional[int]): Semente da qual as sementes das ilhas são derivadas.
+        capacidade_cache (int): Capacidade do cache de fitness de cada ilha (0 desativa).
+        busca_local (Optional[dict]): Parâmetros de `BuscaLocalMemetica` (exceto os dados
+            e a semente) usados em cada ilha (None desativa o refinamento memético).
+    """
+
+    def __init__(self, dados: np.ndarray, *, n_ilhas: int = 4, tamanho: int = 20,
+                 estrategias: Sequence[Type[RecombinadorStrategy]] = (),
+                 intervalo_migracao: int = 25, n_migrantes: int = 2, topologia: str = "anel",
+                 vetorizada: bool = True, semente: Optional[int] = None,
+                 capacidade_cache: int = 0, busca_local: Optional[dict] = None) -> None:
+        """
+        Inicializa o modelo de ilhas.
+
+        Args:
+            dados: Base de dados a ser utilizada para o cálculo do fitness.
+            n_ilhas: Quantidade de ilhas (processos).
+            tamanho: Número de indivíduos de cada ilha.
+            estrategias: Classes de estratégia de recombinação, uma por ilha.
+            intervalo_migracao: Gerações entre duas migrações.
+            n_migrantes: Indivíduos enviados por ilha a cada migração.
+            topologia: Topologia de migração ("anel" ou "completa").
+            vetorizada: Se True, as ilhas usam `PopulacaoVetorizada`.
+            semente: Semente da qual as sementes das ilhas são derivadas.
+            capacidade_cache: Capacidade do cache de fitness de cada ilha (0 desativa).
+            busca_local: Parâmetros de `BuscaLocalMemetica` usados em cada ilha
+                (None desativa o refinamento memético).
+
+        Raises:
+            ValueError: Se a topologia for inválida ou nenhuma estratégia for informada.
+        """
+        if topologia not in TOPOLOGIAS:
+            raise ValueError(f"Topologia inválida. Use uma de {TOPOLOGIAS}.")
+        if not estrategias:
+            raise ValueError("Informe ao menos uma estratégia de recombinação.")
+
+        self.dados = dados
+        self.n_ilhas = n_ilhas
+        self.tamanho = tamanho
+        self.estrategias = [estrategias[i % len(estrategias)] for i in range(n_ilhas)]
+        self.intervalo_migracao = intervalo_migracao
+        self.n_migrantes = n_migrantes
+        self.topologia = topologia
+        self.vetorizada = vetorizada
+        self.semente = semente
+        self.capacidade_cache = capacidade_cache
+        self.busca_local = busca_local
+
+    def _destinos(self, emigrantes: List[Tuple[np.ndarray, np.ndarray]]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Define os imigrantes de cada ilha a partir dos emigrantes de todas elas.
+
+        Args:
+            emigrantes: Lista (cromossomos, fitness) enviada por cada ilha.
+
+        Returns:
+            Lista (cromossomos, fitness) a ser recebida por cada ilha.
+        """
+        if self.topologia == "anel":
+            return [emigrantes[(i - 1) % self.n_ilhas] for i in range(self.n_ilhas)]
+
+        imigrantes = []
+        for i in range(self.n_ilhas):
+            outras = [emigrantes[j] for j in range(self.n_ilhas) if j != i]
+            cromossomos = np.concatenate([c for c, _ in outras])
+            fitness = np.concatenate([f for _, f in outras])
+            melhores = np.argsort(fitness, kind="stable")[:self.n_migrantes]
+            imigrantes.append((cromossomos[melhores], fitness[melhores]))
+        return imigrantes
+
+    def executar(self, criterio: StoppingCriteria, *, dmax: float = 1.0, prob_mutacao: float = 0.05,
+                 porcentagem_elite: float = 0.2) -> Tuple[Individuo, List[float], np.ndarray]:
+        """
+        Evolui todas as ilhas em paralelo, com migrações periódicas.
+
+        As ilhas evoluem em épocas de `intervalo_migracao` gerações sem consultar
+        o coordenador; por isso, os critérios de parada são verificados ao fim de
+        cada época (o limite de gerações, quando houver, é respeitado exatamente).
+        As avaliações de fitness somam as de todas as ilhas.
+
+        Args:
+            criterio: Critérios de parada, contados em gerações e avaliações de
+                fitness (o motivo fica em `criterio.reason`).
+            dmax: Valor máximo de alteração para cada coordenada durante a mutação.
+            prob_mutacao: Probabilidade de mutação para cada centróide.
+            porcentagem_elite: Proporção dos melhores indivíduos preservados em cada ilha.
+
+        Returns:
+            Tupla (melhor, historico, cromossomos): o melhor indivíduo entre todas as
+            ilhas, o melhor fitness global ao fim de cada geração e o cromossomo
+            correspondente a cada geração, formato (geracoes, k, d).
+
+        Raises:
+            ValueError: Se nenhum critério limitar a evolução.
+        """
+        if not criterio.is_bounded():
+            raise ValueError("Informe ao menos um critério de parada (gerações, paciência, avaliações ou tempo).")
+
+        parametros = {"dmax": dmax, "prob_mutacao": prob_mutacao, "porcentagem_elite": porcentagem_elite,
+                      "capacidade_cache": self.capacidade_cache, "busca_local": self.busca_local}
+        sementes = [int(s.generate_state(1)[0])
+                    for s in np.random.SeedSequence(self.semente).spawn(self.n_ilhas)]
+
+        conexoes, processos = [], []
+        for semente, estrategia in zip(sementes, self.estrategias):
+            coordenador, trabalhador = mp.Pipe()
+            processo = mp.Process(target=_executar_ilha, daemon=True,
+                                  args=(trabalhador, self.dados, self.tamanho, semente,
+                                        estrategia, self.vetorizada, parametros))
+            processo.start()
+            trabalhador.close()
+            conexoes.append(coordenador)
+            processos.append(processo)
+
+        historico: List[float] = []
+        cromossomos_historico: List[np.ndarray] = []
+        try:
+            criterio.start()
+            while not criterio.should_stop():
+                geracoes = self.intervalo_migracao
+                if criterio.max_iter is not None:
+                    geracoes = min(geracoes, criterio.max_iter - criterio.iterations)
+                for conexao in conexoes:
+                    conexao.send(("evoluir", geracoes, self.n_migrantes))
+                respostas = [conexao.recv() for conexao in conexoes]
+
+                # Melhor global por geração: mínimo entre os históricos das ilhas (o primeiro em caso de empate)
+                historicos = np.array([h for h, _, _, _ in respostas])
+                ilhas = np.argmin(historicos, axis=0)
+                geracoes_epoca = np.arange(historicos.shape[1])
+                melhores = historicos[ilhas, geracoes_epoca].tolist()
+                historico.extend(melhores)
+                cromossomos_historico.extend(np.stack([c for _, c, _, _ in respostas])[ilhas, geracoes_epoca])
+                for fitness in melhores[:-1]:
+                    criterio.update(fitness)
+                criterio.update(melhores[-1], evaluations=sum(a for _, _, _, a in respostas))
+
+                if not criterio.should_stop() and self.n_ilhas > 1:
+                    imigrantes = self._destinos([e for _, _, e, _ in respostas])
+                    for conexao, (cromossomos, fitness) in zip(conexoes, imigrantes):
+                        conexao.send(("imigrar", cromossomos, fitness))
+
+            for conexao in conexoes:
+                conexao.send(("fim",))
+            resultados = [conexao.recv() for conexao in conexoes]
+        except BaseException:
+            for processo in processos:
+                processo.terminate()
+            raise
+        finally:
+            for processo in processos:
+                processo.join()
+
+        cromossomo, fitness = min(resultados, key=lambda resultado: resultado[1])
+        melhor = Individuo(data=self.dados, individuo=cromossomo)
+        melhor.fitness = fitness
+        return melhor, historico, np.array(cromossomos_historico)
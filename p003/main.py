@@ -1,9 +1,17 @@
-import pandas as pd
+import os
+import sys
+from typing import List, Optional
+from Individuo import Individuo
 from Populacao import Populacao
-from processamento import preprocess_data
+from PopulacaoVetorizada import PopulacaoVetorizada
+from ilhas import ModeloIlhas
+from processamento import load_preprocessed
+from avaliacao import CacheFitness, ativar_cache, total_avaliacoes
+from parada import StoppingCriteria
+from memetico import BuscaLocalMemetica
+from registro import RegistroExecucao
 from TrocaExtremidadesStrategy import TrocaExtremidadesStrategy
 from MediaStrategy import MediaStrategy
-import matplotlib.pyplot as plt
 
 
 
@@ -23,75 +31,191 @@ def main():
     __PORCENTAGEM_ELITE__ :float = 0.23
     __DMAX__ :float = 1.0
     __TAMANHO_POPULACAO__ :int = 20
+    __POPULACAO_VETORIZADA__ :bool = False  # True usa a população baseada em arrays (PopulacaoVetorizada)
+    __N_ILHAS__ :int = 1
+    __INTERVALO_MIGRACAO__ :int = 25
+    __N_MIGRANTES__ :int = 2
+    __TOPOLOGIA__ :str = "anel"
+    __CAPACIDADE_CACHE__ :int = 4096
+    __ARQUIVO_SAIDA__ :str = "saida.csv"
+    __FORMATO_SAIDA__ :str = "csv"
+    __PACIENCIA__ :int = None           # gerações sem melhora toleradas (None desativa)
+    __MELHORA_MINIMA__ :float = 0.0     # melhora relativa mínima para reiniciar a paciência
+    __MAX_AVALIACOES__ :int = None      # orçamento de avaliações de fitness (None desativa)
+    __TEMPO_LIMITE__ :float = None      # limite de tempo em segundos (None desativa)
+    __INTERVALO_MEMETICO__ :int = 25    # gerações entre refinamentos por busca local (0 desativa)
+    __ELITE_MEMETICA__ :int = 2         # melhores indivíduos refinados
+    __PASSO_MEMETICO__ :float = 0.3     # passo inicial dos deslocamentos da busca local
+    __AVALIACOES_MEMETICAS__ :int = 500 # orçamento de avaliações de cada refinamento
+    # sem interface gráfica (`python main.py --headless` ou HEADLESS=1): não gera o gráfico nem importa o matplotlib
+    __HEADLESS__ :bool = "--headless" in sys.argv[1:] or os.environ.get("HEADLESS", "0") not in ("", "0")
 
   
-    # Carregar e preparar os dados
-    data = load_data("data/wine.data")
+    # Carregar e preparar os dados (matriz normalizada em cache binário, reaproveitada entre execuções)
     features = ['Flavanoids', 'Total_Phenols']
-    reduced_data, scaler = preprocess_data(data, features)
-
-    # Criar a população inicial
-    populacao = Populacao(tamanho=__TAMANHO_POPULACAO__, dados=reduced_data)
+    reduced_data, scaler = load_preprocessed("data/wine.data", features)
+
+    # Cache LRU de fitness: cromossomos repetidos (elite, sorteios com reposição) não são reavaliados
+    cache = CacheFitness(reduced_data, capacidade=__CAPACIDADE_CACHE__) if __CAPACIDADE_CACHE__ > 0 else None
+    ativar_cache(cache)
+
+    # Coordenadas por indivíduo registradas no arquivo de saída (k centróides de dimensão d)
+    n_coordenadas = Individuo.N_CENTROIDES * reduced_data.shape[1]
+
+    # Refinamento memético: descida de primeira melhora nos melhores indivíduos
+    parametros_busca_local = None
+    if __INTERVALO_MEMETICO__ > 0:
+        parametros_busca_local = {"intervalo": __INTERVALO_MEMETICO__, "n_elite": __ELITE_MEMETICA__,
+                                  "passo": __PASSO_MEMETICO__, "max_avaliacoes": __AVALIACOES_MEMETICAS__}
+
+    # Critérios de parada: o primeiro atingido encerra a evolução
+    criterio = StoppingCriteria(max_iter=__TOTAL_GERACAO__, patience=__PACIENCIA__,
+                                min_improvement=__MELHORA_MINIMA__, max_evaluations=__MAX_AVALIACOES__,
+                                time_limit=__TEMPO_LIMITE__)
+
+    if __N_ILHAS__ > 1:
+        # Modelo de ilhas: cada ilha evolui em um processo próprio, alternando as estratégias
+        modelo = ModeloIlhas(reduced_data, n_ilhas=__N_ILHAS__, tamanho=__TAMANHO_POPULACAO__,
+                             estrategias=[MediaStrategy, TrocaExtremidadesStrategy],
+                             intervalo_migracao=__INTERVALO_MIGRACAO__, n_migrantes=__N_MIGRANTES__,
+                             topologia=__TOPOLOGIA__, vetorizada=__POPULACAO_VETORIZADA__,
+                             capacidade_cache=__CAPACIDADE_CACHE__, busca_local=parametros_busca_local)
+        melhor, historico, cromossomos = modelo.executar(criterio, dmax=__DMAX__, prob_mutacao=__PROB_MUTACAO__,
+                                                         porcentagem_elite=__PORCENTAGEM_ELITE__)
+
+        # Melhor indivíduo global de cada geração, no mesmo formato da população única
+        with RegistroExecucao(__ARQUIVO_SAIDA__, n_coordenadas, formato=__FORMATO_SAIDA__) as registro:
+            for geracao, (fitness, cromossomo) in enumerate(zip(historico, cromossomos)):
+                registro.registrar(geracao, fitness, cromossomo)
+        print("Melhor indivíduo entre as ilhas:", melhor.tolist())
+    else:
+        busca_local = None
+        if parametros_busca_local is not None:
+            busca_local = BuscaLocalMemetica(reduced_data, **parametros_busca_local)
+        with RegistroExecucao(__ARQUIVO_SAIDA__, n_coordenadas, formato=__FORMATO_SAIDA__) as registro:
+            historico = executar_populacao_unica(reduced_data, criterio, __TAMANHO_POPULACAO__,
+                                                 __POPULACAO_VETORIZADA__, __DMAX__, __PROB_MUTACAO__,
+                                                 __PORCENTAGEM_ELITE__, registro, busca_local)
+
+        print(f"Avaliações de fitness sobre a base: {total_avaliacoes()}")
+        if not __POPULACAO_VETORIZADA__:
+            # Contadores do motor de objetos: as avaliações em lote dos filhos não passam pelos indivíduos
+            contadores = Individuo.contadores
+            print(f"Indivíduos: {contadores['avaliacoes']} avaliações sob demanda, "
+                  f"{contadores['poupadas']} recálculos evitados, "
+                  f"{contadores['invalidacoes']} invalidações")
+        if cache is not None:
+            estatisticas = cache.estatisticas()
+            print(f"Cache de fitness: {estatisticas['acertos']} acertos, "
+                  f"{estatisticas['repetidos']} repetidos no mesmo lote, "
+                  f"{estatisticas['falhas']} avaliações (taxa de acerto: {estatisticas['taxa_acerto']:.1%})")
+
+    print(f"Parada: {criterio.reason} ({criterio.iterations} gerações, "
+          f"{criterio.evaluations} avaliações de fitness)")
     
-    # Estrarégias para gerar filhos
-    troca_extremidades_strategy = TrocaExtremidadesStrategy(data=reduced_data)
-    media_strategy = MediaStrategy(data=reduced_data)
-
-    historico = []
-
-    i =0
-    while i < __TOTAL_GERACAO__:
-
+    # gerar o gráfico de convergência do melhor indivíduo por geração
+    if not __HEADLESS__:
+        plotar_convergencia(historico, f"convergencia{__TOTAL_GERACAO__}.png")
 
-        populacao.selecionar_individuos()
-        historico.append(populacao.melhor_global.fitness)
 
-        populacao.recombinar(recombinador=media_strategy)
-    
-        populacao.mutar_populacao(dmax=__DMAX__, prob_mutacao=__PROB_MUTACAO__)
+def plotar_convergencia(historico: List[float], arquivo: str) -> None:
+    """
+    Plota, salva e exibe o fitness do melhor indivíduo por geração.
 
-        populacao.substituir_populacao(porcentagem_elite=__PORCENTAGEM_ELITE__)
+    O matplotlib é importado apenas aqui, para que execuções sem gráficos (e os
+    processos das ilhas) não paguem o custo da importação.
 
-        # Salvar o melhor indivíduo global no arquivo saida.out
-        with open("saida.out", "a") as f:
-            f.write("-" * 60 + "\n")
-            f.write("Melhor indivíduo da global:\n")
-            f.write(str(populacao.melhor_global.tolist()) + "\n")
-            f.write("-" * 60 + "\n")
+    Parâmetros:
+        historico (List[float]): Fitness do melhor indivíduo global em cada geração.
+        arquivo (str): Arquivo de imagem em que o gráfico é salvo.
+    """
+    import matplotlib.pyplot as plt
 
-        i += 1
-    
-    # gerar o gráfico de convergência do melhor indivíduo por geração
     plt.figure(figsize=(10, 6))
     plt.plot(historico, 'b-', label="Fitness do Melhor Indivíduo")
     plt.axhline(y=93.7869, color='r', linestyle='--', label="Saída do KMeans")
     plt.axhline(y=92.2274, color='g', linestyle='--', label="Saída da Busca Local")
     
-    plt.title("Convergência do melhor indivíduo por geração. Gerações: " + str(__TOTAL_GERACAO__))
+    plt.title("Convergência do melhor indivíduo por geração. Gerações: " + str(len(historico)))
     plt.xlabel("Geração")
     plt.ylabel("Fitness")
     plt.legend()
     plt.grid(True)
-    plt.savefig(f"convergencia{__TOTAL_GERACAO__}.png")
+    plt.savefig(arquivo)
     plt.show()
 
-def load_data(file_path: str) -> pd.DataFrame:
+
+def executar_populacao_unica(dados, criterio: StoppingCriteria, tamanho_populacao: int, vetorizada: bool,
+                             dmax: float, prob_mutacao: float, porcentagem_elite: float,
+                             registro: RegistroExecucao,
+                             busca_local: Optional[BuscaLocalMemetica] = None) -> list:
     """
-    Carrega os dados do arquivo CSV e define os nomes das colunas.
+    Evolui uma única população até que um dos critérios de parada seja atingido.
 
     Parâmetros:
-        file_path (str): Caminho do arquivo CSV.
+        dados (np.ndarray): Dados normalizados.
+        criterio (StoppingCriteria): Critérios de parada, contados em gerações e avaliações
+            de fitness (o motivo fica em `criterio.reason`).
+        tamanho_populacao (int): Número de indivíduos da população.
+        vetorizada (bool): Se True, usa a população baseada em arrays.
+        dmax (float): Valor máximo de alteração de cada coordenada na mutação.
+        prob_mutacao (float): Probabilidade de mutação de cada centróide.
+        porcentagem_elite (float): Proporção dos melhores indivíduos preservados.
+        registro (RegistroExecucao): Registro que recebe o melhor indivíduo global de cada geração.
+        busca_local (Optional[BuscaLocalMemetica]): Refinamento memético dos melhores
+            indivíduos, aplicado a cada `busca_local.intervalo` gerações (None desativa).
 
     Retorna:
-        pd.DataFrame: Dados carregados com colunas nomeadas.
+        list: Fitness do melhor indivíduo global em cada geração.
+
+    Lança:
+        ValueError: Se nenhum critério limitar a evolução.
     """
-    columns = [
-        'Class', 'Alcohol', 'Malic_Acid', 'Ash', 'Alcalinity_of_Ash',
-        'Magnesium', 'Total_Phenols', 'Flavanoids', 'Nonflavanoid_Phenols',
-        'Proanthocyanins', 'Color_Intensity', 'Hue',
-        'OD280/OD315_of_Diluted_Wines', 'Proline'
-    ]
-    return pd.read_csv(file_path, names=columns)
+    if not criterio.is_bounded():
+        raise ValueError("Informe ao menos um critério de parada (gerações, paciência, avaliações ou tempo).")
+
+    # Avaliações contadas a partir daqui (incluem as da população inicial)
+    criterio.start()
+    avaliacoes = total_avaliacoes()
+
+    # Criar a população inicial (a versão vetorizada guarda todos os cromossomos em um único array)
+    if vetorizada:
+        populacao = PopulacaoVetorizada(tamanho=tamanho_populacao, dados=dados)
+    else:
+        populacao = Populacao(tamanho=tamanho_populacao, dados=dados)
+    
+    # Estrarégias para gerar filhos
+    troca_extremidades_strategy = TrocaExtremidadesStrategy(data=dados)
+    media_strategy = MediaStrategy(data=dados)
+
+    historico = []
+
+    i =0
+    while not criterio.should_stop():
+
+
+        populacao.selecionar_individuos()
+        historico.append(populacao.melhor_global.fitness)
+
+        populacao.recombinar(recombinador=media_strategy)
+    
+        populacao.mutar_populacao(dmax=dmax, prob_mutacao=prob_mutacao)
+
+        populacao.substituir_populacao(porcentagem_elite=porcentagem_elite)
+
+        # Refinamento memético dos melhores indivíduos por busca local
+        if busca_local is not None and busca_local.deve_aplicar(i):
+            populacao.aplicar_busca_local(busca_local)
+
+        # Registrar o melhor indivíduo global (gravado em lotes, em segundo plano)
+        melhor = populacao.melhor_global
+        registro.registrar(i, melhor.fitness, melhor.individuo)
+
+        criterio.update(melhor.fitness, evaluations=total_avaliacoes() - avaliacoes)
+        avaliacoes = total_avaliacoes()
+        i += 1
+
+    return historico
 
 
 def exibir_individuos(titulo: str, individuos: list):
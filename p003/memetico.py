@@ -0,0 +1,163 @@
+import numpy as np
+from itertools import product
+from typing import Optional, Tuple
+from avaliacao import calcular_fitness_lote
+
+
+class BuscaLocalMemetica:
+    """
+    Refinamento memético dos melhores indivíduos por busca local.
+
+    A cada `intervalo` gerações, os `n_elite` melhores cromossomos passam por uma
+    descida de primeira melhora (first improvement) na vizinhança de movimentos
+    de um único centróide: cada vizinho desloca um centróide de ±passo em cada
+    coordenada (as 3^d - 1 direções da grade, como a vizinhança VPD do P002).
+
+    A descida de todos os cromossomos avança em conjunto: a cada rodada, as
+    vizinhanças são percorridas em ordem aleatória, em blocos de `tamanho_bloco`
+    vizinhos por cromossomo, e os blocos de todos os cromossomos ainda sem
+    melhora são avaliados em uma única chamada vetorizada. Cada cromossomo
+    aceita o primeiro vizinho que o melhora; quando nenhum vizinho melhora, o
+    passo é reduzido por `reducao`, até ficar abaixo de `passo_minimo`. Cada
+    refinamento consome no máximo `max_avaliacoes` avaliações de fitness.
+
+    Attributes:
+        dados (np.ndarray): Base de dados utilizada para o cálculo do fitness.
+        intervalo (int): Gerações entre dois refinamentos.
+        n_elite (int): Quantidade de melhores cromossomos refinados.
+        passo (float): Passo inicial dos deslocamentos.
+        reducao (float): Fator de redução do passo quando não há melhora.
+        passo_minimo (float): Passo abaixo do qual a descida de um cromossomo termina.
+        max_avaliacoes (int): Orçamento de avaliações de fitness de cada refinamento.
+        tamanho_bloco (int): Vizinhos de cada cromossomo avaliados por rodada.
+    """
+
+    def __init__(self, dados: np.ndarray, *, intervalo: int = 25, n_elite: int = 2, passo: float = 0.1,
+                 reducao: float = 0.5, passo_minimo: float = 1e-3, max_avaliacoes: int = 500,
+                 tamanho_bloco: int = 8, semente: Optional[int] = None) -> None:
+        """
+        Inicializa a busca local memética.
+
+        Args:
+            dados: Base de dados a ser utilizada para o cálculo do fitness (o mesmo
+                objeto da população, para que o cache de fitness seja aproveitado).
+            intervalo: Gerações entre dois refinamentos.
+            n_elite: Quantidade de melhores cromossomos refinados.
+            passo: Passo inicial dos deslocamentos.
+            reducao: Fator de redução do passo quando não há melhora.
+            passo_minimo: Passo abaixo do qual a descida de um cromossomo termina.
+            max_avaliacoes: Orçamento de avaliações de fitness de cada refinamento.
+            tamanho_bloco: Vizinhos de cada cromossomo avaliados por rodada.
+            semente: Semente do gerador de números aleatórios (opcional).
+
+        Raises:
+            ValueError: Se o intervalo, o orçamento ou o bloco não forem positivos,
+                ou se a redução não estiver em (0, 1).
+        """
+        if intervalo <= 0 or max_avaliacoes <= 0 or tamanho_bloco <= 0:
+            raise ValueError("O intervalo, o orçamento de avaliações e o tamanho do bloco devem ser positivos.")
+        if not 0 < reducao < 1:
+            raise ValueError("A redução do passo deve estar no intervalo (0, 1).")
+
+        self.dados = dados
+        self.intervalo = intervalo
+        self.n_elite = n_elite
+        self.passo = passo
+        self.reducao = reducao
+        self.passo_minimo = passo_minimo
+        self.max_avaliacoes = max_avaliacoes
+        self.tamanho_bloco = tamanho_bloco
+        self.rng = np.random.default_rng(semente)
+
+    def deve_aplicar(self, geracao: int) -> bool:
+        """
+        Indica se o refinamento deve ser aplicado ao fim da geração informada.
+
+        Args:
+            geracao: Número da geração (a partir de 0).
+
+        Returns:
+            True a cada `intervalo` gerações.
+        """
+        return (geracao + 1) % self.intervalo == 0
+
+    def _deslocamentos(self, k: int, d: int) -> np.ndarray:
+        """
+        Deslocamentos unitários da vizinhança: cada linha move um único centróide
+        em uma das 3^d - 1 direções da grade.
+
+        Returns:
+            Array (k * (3^d - 1), k, d).
+        """
+        direcoes = np.array([p for p in product((-1.0, 0.0, 1.0), repeat=d) if any(p)])
+        deslocamentos = np.zeros((k, len(direcoes), k, d))
+        for j in range(k):
+            deslocamentos[j, :, j] = direcoes
+        return deslocamentos.reshape(-1, k, d)
+
+    def refinar(self, cromossomos: np.ndarray, fitness: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Aplica a descida de primeira melhora aos cromossomos informados.
+
+        Args:
+            cromossomos: Cromossomos a refinar, formato (n, k, d).
+            fitness: Fitness de cada cromossomo, formato (n,).
+
+        Returns:
+            Tupla (cromossomos, fitness, avaliacoes): os cromossomos refinados (nunca
+            piores que os originais), seus fitness e as avaliações consumidas.
+        """
+        cromossomos = np.array(cromossomos, dtype=float)
+        fitness = np.array(fitness, dtype=float)
+        n, k, d = cromossomos.shape
+        deslocamentos = self._deslocamentos(k, d)
+        n_vizinhos = len(deslocamentos)
+
+        passos = np.full(n, self.passo)
+        ativos = np.ones(n, dtype=bool)
+        avaliacoes = 0
+        sem_orcamento = False
+
+        while ativos.any() and not sem_orcamento:
+            # Nova rodada: vizinhança de cada cromossomo ativo, em ordem aleatória
+            linhas = np.flatnonzero(ativos)
+            ordens = self.rng.permuted(np.tile(np.arange(n_vizinhos), (len(linhas), 1)), axis=1)
+            buscando = np.ones(len(linhas), dtype=bool)
+
+            for inicio in range(0, n_vizinhos, self.tamanho_bloco):
+                restantes = np.flatnonzero(buscando)
+                tamanho = min(self.tamanho_bloco, n_vizinhos - inicio)
+                orcamento = (self.max_avaliacoes - avaliacoes) // len(restantes)
+                if orcamento < tamanho:
+                    # O orçamento não cobre o bloco: avalia o que couber e encerra o refinamento
+                    sem_orcamento = True
+                    tamanho = orcamento
+                    if tamanho == 0:
+                        break
+                bloco = ordens[restantes, inicio:inicio + tamanho]
+
+                # Blocos de todos os cromossomos ainda sem melhora, avaliados de uma só vez
+                origem = linhas[restantes]
+                candidatos = (cromossomos[origem, np.newaxis]
+                              + passos[origem, np.newaxis, np.newaxis, np.newaxis] * deslocamentos[bloco])
+                custos = calcular_fitness_lote(self.dados, candidatos.reshape(-1, k, d)).reshape(bloco.shape)
+                avaliacoes += custos.size
+
+                # Primeira melhora de cada cromossomo, na ordem aleatória da vizinhança
+                melhora = custos < fitness[origem, np.newaxis]
+                melhorou = melhora.any(axis=1)
+                primeiro = np.argmax(melhora, axis=1)[melhorou]
+                aceitos = origem[melhorou]
+                cromossomos[aceitos] = candidatos[melhorou, primeiro]
+                fitness[aceitos] = custos[melhorou, primeiro]
+
+                buscando[restantes[melhorou]] = False
+                if sem_orcamento or not buscando.any():
+                    break
+            else:
+                # Vizinhança esgotada sem melhora: reduz o passo (ou encerra a descida)
+                esgotados = linhas[buscando]
+                passos[esgotados] *= self.reducao
+                ativos[esgotados[passos[esgotados] < self.passo_minimo]] = False
+
+        return cromossomos, fitness, avaliacoes
@@ -0,0 +1,157 @@
+import time
+from typing import Optional
+
+# Este módulo é mantido idêntico em P002/src/parada.py e em p003/parada.py:
+# qualquer correção deve ser aplicada aos dois arquivos.
+
+# Motivos de parada reportados em `StoppingCriteria.reason`
+MAX_ITER = "max_iter"
+STAGNATION = "stagnation"
+MAX_EVALUATIONS = "max_evaluations"
+TIME_LIMIT = "time_limit"
+COMPLETED = "completed"
+
+
+class StoppingCriteria:
+    """
+    Critérios de parada compartilhados pelas buscas (P002) e pelo algoritmo
+    genético (p003).
+
+    Combina limite de iterações (ou gerações), estagnação (nenhuma melhora
+    relativa maior que `min_improvement` em `patience` iterações consecutivas),
+    orçamento de avaliações e limite de tempo de relógio. Qualquer critério
+    atingido encerra a busca, que devolve a melhor solução encontrada até ali;
+    o motivo fica registrado em `reason`.
+
+    Uso típico em uma busca iterativa:
+
+        stopping.start(initial_cost)
+        while not stopping.should_stop():
+            ...  # uma iteração
+            stopping.update(best_cost, evaluations=n_avaliados)
+        stopping.finish(COMPLETED)
+
+    Buscas de uma única varredura longa podem consultar `record` a cada bloco
+    avaliado, para respeitar o orçamento e o prazo no meio da varredura.
+
+    Attributes:
+        max_iter (Optional[int]): Número máximo de iterações (None = sem limite).
+        patience (Optional[int]): Iterações consecutivas sem melhora toleradas (None = desativado).
+        min_improvement (float): Melhora relativa mínima para reiniciar a contagem de estagnação.
+        max_evaluations (Optional[int]): Orçamento de avaliações (None = sem limite).
+        time_limit (Optional[float]): Limite de tempo em segundos, contado a partir de `start`.
+        iterations (int): Iterações concluídas.
+        evaluations (int): Avaliações realizadas.
+        reason (Optional[str]): Motivo da parada (None enquanto a busca não parou).
+    """
+    __slots__ = ['max_iter', 'patience', 'min_improvement', 'max_evaluations', 'time_limit',
+                 'iterations', 'evaluations', 'reason', '_reference_cost', '_stalled', '_deadline']
+
+    def __init__(self, max_iter: Optional[int] = None, patience: Optional[int] = None,
+                 min_improvement: float = 0.0, max_evaluations: Optional[int] = None,
+                 time_limit: Optional[float] = None) -> None:
+        """
+        Inicializa os critérios de parada.
+
+        Args:
+            max_iter: Número máximo de iterações (None = sem limite).
+            patience: Iterações consecutivas sem melhora toleradas (None = desativado).
+            min_improvement: Melhora relativa mínima, por exemplo 1e-4 para 0,01%
+                (default: 0, qualquer redução de custo conta como melhora).
+            max_evaluations: Orçamento de avaliações (None = sem limite).
+            time_limit: Limite de tempo em segundos (None = sem limite).
+        """
+        self.max_iter = max_iter
+        self.patience = patience
+        self.min_improvement = min_improvement
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+        self.start()
+
+    def is_bounded(self) -> bool:
+        """
+        Indica se algum critério garante o término de uma busca sem fim natural.
+        """
+        return any(limit is not None for limit in (self.max_iter, self.patience, self.max_evaluations, self.time_limit))
+
+    def start(self, initial_cost: float = float('inf')) -> "StoppingCriteria":
+        """
+        Reinicia os contadores e começa a contar o tempo.
+
+        Args:
+            initial_cost: Custo da solução inicial (referência para a estagnação).
+
+        Returns:
+            A própria instância.
+        """
+        self.iterations = 0
+        self.evaluations = 0
+        self.reason = None
+        self._reference_cost = initial_cost
+        self._stalled = 0
+        self._deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        return self
+
+    def record(self, evaluations: int) -> bool:
+        """
+        Contabiliza avaliações e verifica o orçamento e o prazo.
+
+        Args:
+            evaluations: Quantidade de candidatos avaliados.
+
+        Returns:
+            True se o orçamento ou o prazo se esgotou.
+        """
+        self.evaluations += evaluations
+        return self._exhausted()
+
+    def update(self, best_cost: float, evaluations: int = 0) -> None:
+        """
+        Registra o fim de uma iteração.
+
+        Args:
+            best_cost: Melhor custo conhecido ao fim da iteração.
+            evaluations: Quantidade de avaliações realizadas na iteração.
+        """
+        self.iterations += 1
+        self.evaluations += evaluations
+
+        if best_cost < self._reference_cost - self.min_improvement * abs(self._reference_cost):
+            self._reference_cost = best_cost
+            self._stalled = 0
+        else:
+            self._stalled += 1
+
+    def should_stop(self) -> bool:
+        """
+        Verifica todos os critérios antes de uma nova iteração.
+
+        Returns:
+            True se a busca deve parar (o motivo é registrado em `reason`).
+        """
+        if self.reason is not None:
+            return True
+        if self.max_iter is not None and self.iterations >= self.max_iter:
+            self.reason = MAX_ITER
+        elif self.patience is not None and self._stalled >= self.patience:
+            self.reason = STAGNATION
+        return self._exhausted()
+
+    def finish(self, reason: str = COMPLETED) -> None:
+        """
+        Registra o motivo de uma parada natural, se nenhum critério tiver sido atingido antes.
+
+        Args:
+            reason: Motivo da parada (default: 'completed').
+        """
+        if self.reason is None:
+            self.reason = reason
+
+    def _exhausted(self) -> bool:
+        if self.reason is not None:
+            return True
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            self.reason = MAX_EVALUATIONS
+        elif self._deadline is not None and time.perf_counter() >= self._deadline:
+            self.reason = TIME_LIMIT
+        return self.reason is not None
@@ -0,0 +1,140 @@
+import atexit
+import csv
+import queue
+import threading
+import numpy as np
+from typing import List, Optional, Tuple
+
+# Formatos de saída suportados
+FORMATOS = ("csv", "npz")
+
+# Registro de uma geração: (geração, fitness do melhor global, centróides achatados ou None)
+Registro = Tuple[int, float, Optional[np.ndarray]]
+
+
+class RegistroExecucao:
+    """
+    Registro estruturado de uma execução do algoritmo genético.
+
+    Os registros de cada geração são acumulados em memória e entregues em lotes
+    a uma thread em segundo plano, que os grava no arquivo de saída. Assim, o laço
+    de gerações não abre o arquivo nem formata texto a cada geração.
+
+    Formatos:
+        - "csv": uma linha por geração (geracao, fitness, x0, x1, ...),
+          gravada a cada lote.
+        - "npz": arrays `geracao`, `fitness` e `centroides`, gravados ao fechar
+          (o formato não permite acréscimos).
+
+    O registro é descarregado ao chamar `fechar`, ao sair de um bloco `with` ou,
+    em último caso, ao encerrar o interpretador.
+
+    Attributes:
+        caminho (str): Arquivo de saída.
+        n_coordenadas (int): Quantidade de coordenadas dos centróides de um indivíduo (k * d).
+        formato (str): Formato de saída ("csv" ou "npz").
+        tamanho_lote (int): Quantidade de registros acumulados antes de cada gravação.
+    """
+
+    def __init__(self, caminho: str, n_coordenadas: int, formato: str = "csv", tamanho_lote: int = 100) -> None:
+        """
+        Inicializa o registro e inicia a thread de gravação.
+
+        Args:
+            caminho: Arquivo de saída (sobrescrito a cada execução).
+            n_coordenadas: Quantidade de coordenadas dos centróides de um indivíduo (k * d).
+            formato: Formato de saída ("csv" ou "npz").
+            tamanho_lote: Quantidade de registros acumulados antes de cada gravação.
+
+        Raises:
+            ValueError: Se o formato for inválido.
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato inválido. Use um de {FORMATOS}.")
+
+        self.caminho = caminho
+        self.n_coordenadas = n_coordenadas
+        self.formato = formato
+        self.tamanho_lote = tamanho_lote
+
+        self._buffer: List[Registro] = []
+        self._fila: "queue.Queue[Optional[List[Registro]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._gravar, daemon=True)
+        self._thread.start()
+        self._fechado = False
+        atexit.register(self.fechar)
+
+    def __enter__(self) -> "RegistroExecucao":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fechar()
+
+    def registrar(self, geracao: int, fitness: float, centroides: Optional[np.ndarray] = None) -> None:
+        """
+        Acrescenta o registro de uma geração ao buffer.
+
+        Args:
+            geracao: Número da geração.
+            fitness: Fitness do melhor indivíduo global.
+            centroides: Centróides do melhor indivíduo global (opcional; são copiados).
+        """
+        linha = None if centroides is None else np.array(centroides, dtype=float).ravel()
+        self._buffer.append((geracao, float(fitness), linha))
+        if len(self._buffer) >= self.tamanho_lote:
+            self._descarregar()
+
+    def _descarregar(self) -> None:
+        if self._buffer:
+            self._fila.put(self._buffer)
+            self._buffer = []
+
+    def fechar(self) -> None:
+        """
+        Grava os registros pendentes e encerra a thread de gravação.
+        """
+        if self._fechado:
+            return
+        self._fechado = True
+        self._descarregar()
+        self._fila.put(None)
+        self._thread.join()
+        atexit.unregister(self.fechar)
+
+    def _gravar(self) -> None:
+        """
+        Laço da thread de gravação: consome os lotes da fila até receber None.
+        """
+        if self.formato == "npz":
+            registros: List[Registro] = []
+            for lote in iter(self._fila.get, None):
+                registros.extend(lote)
+            self._gravar_npz(registros)
+            return
+
+        vazio = [""] * self.n_coordenadas
+        with open(self.caminho, "w", newline="") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(["geracao", "fitness"] + [f"x{i}" for i in range(self.n_coordenadas)])
+            for lote in iter(self._fila.get, None):
+                escritor.writerows([geracao, fitness] + (vazio if c is None else c.tolist())
+                                   for geracao, fitness, c in lote)
+                arquivo.flush()
+
+    def _gravar_npz(self, registros: List[Registro]) -> None:
+        """
+        Grava todos os registros em um arquivo NPZ.
+
+        Gerações sem centróides recebem NaN na matriz `centroides`.
+        """
+        centroides = np.full((len(registros), self.n_coordenadas), np.nan)
+        for i, (_, _, c) in enumerate(registros):
+            if c is not None:
+                centroides[i] = c
+
+        np.savez_compressed(
+            self.caminho,
+            geracao=np.array([g for g, _, _ in registros], dtype=np.int64),
+            fitness=np.array([f for _, f, _ in registros], dtype=float),
+            centroides=centroides,
+        )